@@ -0,0 +1,31 @@
+"""
+JSON encoding shared by the API server and the remote client.
+
+Uses orjson when it is installed (it is part of the ``api`` extra) and
+falls back to the standard-library ``json`` module otherwise.
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+the stdlib exception either way.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> str:
+        """Encode *obj* as JSON text (orjson)."""
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> str:
+        """Encode *obj* as JSON text (stdlib json)."""
+        return json.dumps(obj)
+
+    loads = json.loads
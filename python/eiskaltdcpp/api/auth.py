@@ -20,7 +20,7 @@ import secrets
 import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import bcrypt
 from jose import JWTError, jwt
@@ -109,12 +109,27 @@ class UserStore:
 
     Users are stored in memory for fast lookups. If a ``persist_path``
     is set, changes are automatically written to disk.
+
+    Passwords are hashed and checked with bcrypt unless ``password_hasher``
+    or ``password_verifier`` is given; each one defaults to bcrypt
+    separately.  A custom hasher therefore needs a matching verifier
+    unless it still produces bcrypt hashes (e.g. bcrypt at a lower cost).
+    Overriding them is meant for tests, where bcrypt's deliberate slowness
+    dominates run time; never use a fast hash in production.
     """
 
-    def __init__(self, persist_path: Optional[str | Path] = None) -> None:
+    def __init__(
+        self,
+        persist_path: Optional[str | Path] = None,
+        *,
+        password_hasher: Optional[Callable[[str], str]] = None,
+        password_verifier: Optional[Callable[[str, str], bool]] = None,
+    ) -> None:
         self._users: dict[str, UserRecord] = {}
         self._lock = threading.Lock()
         self._persist_path = Path(persist_path) if persist_path else None
+        self._hash_password = password_hasher or _hash_password
+        self._verify_password = password_verifier or _verify_password
 
         # Load from disk if file exists
         if self._persist_path and self._persist_path.exists():
@@ -154,7 +169,7 @@ class UserStore:
                 raise ValueError(f"User '{username}' already exists")
             rec = UserRecord(
                 username=username,
-                hashed_password=_hash_password(password),
+                hashed_password=self._hash_password(password),
                 role=role,
             )
             self._users[username] = rec
@@ -183,7 +198,7 @@ class UserStore:
             if rec is None:
                 raise KeyError(f"User '{username}' not found")
             if password is not None:
-                rec.hashed_password = _hash_password(password)
+                rec.hashed_password = self._hash_password(password)
             if role is not None:
                 rec.role = role
             self._save()
@@ -203,7 +218,7 @@ class UserStore:
             rec = self._users.get(username)
             if rec is None:
                 return None
-            if not _verify_password(password, rec.hashed_password):
+            if not self._verify_password(password, rec.hashed_password):
                 return None
             rec.last_login = datetime.now(timezone.utc)
             self._save()
@@ -32,6 +32,7 @@ from urllib.parse import urljoin
 
 import httpx
 
+from eiskaltdcpp.api._json import loads as _loads
 from eiskaltdcpp.exceptions import (
     LuaError,
     LuaLoadError,
@@ -204,7 +205,7 @@ class RemoteEventStream:
         try:
             async for raw in self._ws:
                 try:
-                    msg = json.loads(raw)
+                    msg = _loads(raw)
                 except json.JSONDecodeError:
                     continue
                 if msg.get("type") == "event":
@@ -321,7 +322,7 @@ class RemoteDCClient:
         http = await self._ensure_http()
         resp = await http.get(path, headers=self._headers(), params=params)
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
 
     async def _post(self, path: str, body: Optional[dict] = None,
                     **params) -> dict:
@@ -329,19 +330,19 @@ class RemoteDCClient:
         resp = await http.post(path, headers=self._headers(),
                                json=body, params=params)
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
 
     async def _put(self, path: str, body: dict) -> dict:
         http = await self._ensure_http()
         resp = await http.put(path, headers=self._headers(), json=body)
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
 
     async def _delete(self, path: str, **params) -> dict:
         http = await self._ensure_http()
         resp = await http.delete(path, headers=self._headers(), params=params)
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
 
     @staticmethod
     def _raise_lua_error(message: str, error_type: str = "") -> None:
@@ -369,7 +370,7 @@ class RemoteDCClient:
             "username": username, "password": password,
         })
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
         self._token = data["access_token"]
         self._username = username
         return self._token
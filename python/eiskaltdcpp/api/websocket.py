@@ -21,6 +21,7 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
 from starlette.websockets import WebSocketState
 
+from eiskaltdcpp.api._json import dumps as _dumps, loads as _loads
 from eiskaltdcpp.api.auth import AuthManager, UserRecord
 from eiskaltdcpp.api.dependencies import get_auth_manager, get_dc_client
 from eiskaltdcpp.api.models import UserRole
@@ -109,18 +110,34 @@ EVENT_ARG_NAMES: dict[str, tuple[str, ...]] = {
 }
 
 
+# (time_ns, text) of the last formatted timestamp.
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601, reformatted at most once per millisecond.
+
+    Bursts of events share one string instead of each building and
+    formatting a ``datetime``.
+    """
+    global _ts_cache
+    now_ns = time.time_ns()
+    last_ns, text = _ts_cache
+    if not 0 <= now_ns - last_ns < 1_000_000:
+        text = datetime.fromtimestamp(now_ns / 1e9, timezone.utc).isoformat()
+        _ts_cache = (now_ns, text)
+    return text
+
+
 def _serialize_event(event_type: str, args: tuple) -> dict:
     """Convert an event and its positional args into a JSON-safe dict."""
-    names = EVENT_ARG_NAMES.get(event_type, ())
-    data = {}
-    for i, name in enumerate(names):
-        if i < len(args):
-            data[name] = args[i]
+    # zip() stops at the shorter side: missing trailing args are omitted
+    # and surplus args ignored, matching the event's declared schema.
     return {
         "type": "event",
         "event": event_type,
-        "data": data,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "data": dict(zip(EVENT_ARG_NAMES.get(event_type, ()), args)),
+        "timestamp": _utc_timestamp(),
     }
 
 
@@ -148,7 +165,12 @@ class ConnectionManager:
     """
 
     def __init__(self) -> None:
-        self._connections: list[_ClientConnection] = []
+        self._connections: set[_ClientConnection] = set()
+        # Inverted index channel -> subscribers, kept in step with each
+        # connection's ``channels`` so broadcasts only visit listeners.
+        self._by_channel: dict[Channel, set[_ClientConnection]] = {
+            ch: set() for ch in Channel
+        }
         self._lock = asyncio.Lock()
         self._event_stream_task: Optional[asyncio.Task] = None
         self._status_task: Optional[asyncio.Task] = None
@@ -159,7 +181,9 @@ class ConnectionManager:
         await ws.accept()
         conn = _ClientConnection(ws, user, channels)
         async with self._lock:
-            self._connections.append(conn)
+            self._connections.add(conn)
+            for ch in channels:
+                self._by_channel[ch].add(conn)
         logger.info("WS connected: user=%s channels=%s (total=%d)",
                     user.username, [c.value for c in channels],
                     len(self._connections))
@@ -168,42 +192,75 @@ class ConnectionManager:
     async def disconnect(self, conn: _ClientConnection) -> None:
         """Remove a WebSocket connection."""
         async with self._lock:
-            if conn in self._connections:
-                self._connections.remove(conn)
+            self._remove_locked(conn)
         logger.info("WS disconnected: user=%s (total=%d)",
                     conn.user.username, len(self._connections))
 
+    def _remove_locked(self, conn: _ClientConnection) -> None:
+        """Drop a connection from all bookkeeping (call while holding lock)."""
+        self._connections.discard(conn)
+        for subscribers in self._by_channel.values():
+            subscribers.discard(conn)
+
+    async def subscribe(self, conn: _ClientConnection,
+                        channels: set[Channel]) -> None:
+        """Add channels to a connection's subscriptions."""
+        async with self._lock:
+            conn.channels |= channels
+            if conn in self._connections:
+                for ch in channels:
+                    self._by_channel[ch].add(conn)
+
+    async def unsubscribe(self, conn: _ClientConnection,
+                          channels: set[Channel]) -> None:
+        """Remove channels from a connection's subscriptions."""
+        async with self._lock:
+            conn.channels -= channels
+            for ch in channels:
+                self._by_channel[ch].discard(conn)
+
     async def broadcast(self, message: dict, channels: set[Channel],
                         require_admin: bool = False) -> None:
         """Send a message to all connections subscribed to any of the channels."""
-        text = json.dumps(message)
         async with self._lock:
-            targets = list(self._connections)
-
-        dead: list[_ClientConnection] = []
-        for conn in targets:
-            if not conn.channels.intersection(channels):
-                continue
-            if require_admin and conn.user.role != UserRole.admin:
-                continue
-            try:
-                if conn.ws.client_state == WebSocketState.CONNECTED:
-                    await conn.ws.send_text(text)
-            except Exception:
-                dead.append(conn)
+            subscribers = set().union(
+                *(self._by_channel[ch] for ch in channels)
+            )
+            targets = [
+                conn for conn in subscribers
+                if not require_admin or conn.user.role == UserRole.admin
+            ]
+        if not targets:
+            return
+        # Encode once for every recipient, and only if someone listens.
+        text = _dumps(message)
+
+        # Send to all subscribers concurrently so one slow client does not
+        # delay the rest; a failed send marks that connection dead.
+        results = await asyncio.gather(
+            *(self._send_text(conn, text) for conn in targets),
+            return_exceptions=True,
+        )
+        dead = [conn for conn, result in zip(targets, results)
+                if isinstance(result, Exception)]
 
         if dead:
             async with self._lock:
                 for d in dead:
-                    if d in self._connections:
-                        self._connections.remove(d)
+                    self._remove_locked(d)
+
+    @staticmethod
+    async def _send_text(conn: _ClientConnection, text: str) -> None:
+        """Send an encoded frame if the socket is still open."""
+        if conn.ws.client_state == WebSocketState.CONNECTED:
+            await conn.ws.send_text(text)
 
     async def send_personal(self, conn: _ClientConnection,
                             message: dict) -> None:
         """Send a message to a single connection."""
         try:
             if conn.ws.client_state == WebSocketState.CONNECTED:
-                await conn.ws.send_text(json.dumps(message))
+                await conn.ws.send_text(_dumps(message))
         except Exception:
             pass
 
@@ -267,7 +324,7 @@ class ConnectionManager:
                             "download_speed": getattr(stats, "downloadSpeed", 0),
                             "upload_speed": getattr(stats, "uploadSpeed", 0),
                         },
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": _utc_timestamp(),
                     }
                     await self.broadcast(message, {Channel.status, Channel.events})
                 except Exception:
@@ -300,6 +357,63 @@ async def _authenticate_ws(
     return user
 
 
+# ============================================================================
+# Client message handling
+# ============================================================================
+
+def _channels_from_names(names) -> set[Channel]:
+    """Map channel names to Channels, skipping unknown ones."""
+    result = set()
+    for ch_name in names:
+        try:
+            result.add(Channel(ch_name))
+        except ValueError:
+            pass
+    return result
+
+
+def _parse_channels(channels: str) -> set[Channel]:
+    """Parse the ``channels`` query param; defaults to ``{events}``."""
+    requested = _channels_from_names(
+        ch_name.strip().lower() for ch_name in channels.split(",")
+    )
+    return requested or {Channel.events}
+
+
+async def _handle_client_message(conn: _ClientConnection, raw: str) -> None:
+    """Handle one text frame from a client and send the reply."""
+    try:
+        msg = _loads(raw)
+    except json.JSONDecodeError:  # orjson's error subclasses this
+        await ws_manager.send_personal(conn, {
+            "type": "error",
+            "message": "Invalid JSON",
+        })
+        return
+
+    msg_type = msg.get("type", "")
+
+    if msg_type == "ping":
+        await ws_manager.send_personal(conn, {"type": "pong"})
+
+    elif msg_type in ("subscribe", "unsubscribe"):
+        changed = _channels_from_names(msg.get("channels", []))
+        if msg_type == "subscribe":
+            await ws_manager.subscribe(conn, changed)
+        else:
+            await ws_manager.unsubscribe(conn, changed)
+        await ws_manager.send_personal(conn, {
+            "type": "subscribed",
+            "channels": [c.value for c in conn.channels],
+        })
+
+    else:
+        await ws_manager.send_personal(conn, {
+            "type": "error",
+            "message": f"Unknown message type: {msg_type}",
+        })
+
+
 # ============================================================================
 # WebSocket endpoint
 # ============================================================================
@@ -341,16 +455,7 @@ async def websocket_events(
         await ws.close(code=4001, reason="Invalid or missing token")
         return
 
-    # Parse requested channels
-    requested = set()
-    for ch_name in channels.split(","):
-        ch_name = ch_name.strip().lower()
-        try:
-            requested.add(Channel(ch_name))
-        except ValueError:
-            pass
-    if not requested:
-        requested = {Channel.events}
+    requested = _parse_channels(channels)
 
     # Restrict admin-only channels for readonly users
     # (currently all channels are available to all authenticated users)
@@ -376,47 +481,7 @@ async def websocket_events(
             except WebSocketDisconnect:
                 break
 
-            try:
-                msg = json.loads(raw)
-            except json.JSONDecodeError:
-                await ws_manager.send_personal(conn, {
-                    "type": "error",
-                    "message": "Invalid JSON",
-                })
-                continue
-
-            msg_type = msg.get("type", "")
-
-            if msg_type == "ping":
-                await ws_manager.send_personal(conn, {"type": "pong"})
-
-            elif msg_type == "subscribe":
-                for ch_name in msg.get("channels", []):
-                    try:
-                        conn.channels.add(Channel(ch_name))
-                    except ValueError:
-                        pass
-                await ws_manager.send_personal(conn, {
-                    "type": "subscribed",
-                    "channels": [c.value for c in conn.channels],
-                })
-
-            elif msg_type == "unsubscribe":
-                for ch_name in msg.get("channels", []):
-                    try:
-                        conn.channels.discard(Channel(ch_name))
-                    except ValueError:
-                        pass
-                await ws_manager.send_personal(conn, {
-                    "type": "subscribed",
-                    "channels": [c.value for c in conn.channels],
-                })
-
-            else:
-                await ws_manager.send_personal(conn, {
-                    "type": "error",
-                    "message": f"Unknown message type: {msg_type}",
-                })
+            await _handle_client_message(conn, raw)
 
     except Exception:
         logger.exception("WebSocket error for user %s", user.username)
@@ -485,10 +485,18 @@ class AsyncDCClient:
         """Check if connected to a specific hub."""
         return self._sync_client.is_connected(url)
 
+    def connected_hubs(self) -> list[str]:
+        """URLs of all connected hubs."""
+        return self._sync_client.connected_hubs()
+
     def list_hubs(self) -> list:
         """List connected hubs."""
         return self._sync_client.list_hubs()
 
+    def get_hub(self, url: str) -> Any:
+        """Info for one hub by URL, or None if it is not known."""
+        return self._sync_client.get_hub(url)
+
     # ------------------------------------------------------------------
     # Chat (async)
     # ------------------------------------------------------------------
@@ -553,6 +561,10 @@ class AsyncDCClient:
         """Get list of users on a hub."""
         return self._sync_client.get_users(hub_url)
 
+    def get_user_count(self, hub_url: str) -> int:
+        """Get the number of users on a hub."""
+        return self._sync_client.get_user_count(hub_url)
+
     def get_user(self, nick: str, hub_url: str) -> Any:
         """Get info about a specific user."""
         return self._sync_client.get_user(nick, hub_url)
@@ -877,6 +889,9 @@ class AsyncDCClient:
     def set_setting(self, name: str, value: str) -> None:
         self._sync_client.set_setting(name, value)
 
+    def set_settings(self, **settings: Any) -> None:
+        self._sync_client.set_settings(**settings)
+
     def start_networking(self) -> None:
         """(Re)start the networking stack (connection listeners)."""
         self._sync_client.start_networking()
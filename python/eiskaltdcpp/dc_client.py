@@ -331,6 +331,15 @@ class DCClient:
         """Check if connected to a specific hub."""
         return self._bridge.isHubConnected(url)
 
+    def get_hub(self, url: str) -> Any:
+        """Info for one hub by URL, or None if it is not known."""
+        info = self._bridge.getHubInfo(url)
+        return info if info.url else None
+
+    def connected_hubs(self) -> list[str]:
+        """URLs of all hubs we are currently connected to."""
+        return list(self._bridge.connectedHubs())
+
     # ------------------------------------------------------------------
     # Chat
     # ------------------------------------------------------------------
@@ -357,6 +366,10 @@ class DCClient:
         """Get list of users on a hub."""
         return list(self._bridge.getHubUsers(hub_url))
 
+    def get_user_count(self, hub_url: str) -> int:
+        """Get the number of users on a hub without fetching the list."""
+        return self._bridge.getHubUserCount(hub_url)
+
     def get_user(self, nick: str, hub_url: str) -> Any:
         """Get information about a specific user."""
         return self._bridge.getUserInfo(nick, hub_url)
@@ -556,6 +569,18 @@ class DCClient:
         """Set a DC client setting."""
         self._bridge.setSetting(name, value)
 
+    def set_settings(self, **settings: Any) -> None:
+        """Set several DC client settings at once.
+
+        Values are converted with ``str()``.  The settings file is
+        written once for the whole batch.
+
+        Example::
+
+            client.set_settings(Nick="MyBot", Description="A bot")
+        """
+        self._bridge.setSettings({k: str(v) for k, v in settings.items()})
+
     def start_networking(self) -> None:
         """(Re)start the networking stack (connection listeners).
 
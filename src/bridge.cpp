@@ -451,6 +451,26 @@ bool DCBridge::isHubConnected(const std::string& hubUrl) {
     return hd && hd->cachedInfo.connected;
 }
 
+HubInfo DCBridge::getHubInfo(const std::string& hubUrl) {
+    if (!m_initialized.load()) return HubInfo();
+
+    std::lock_guard<std::mutex> lock(m_mutex);
+    auto* hd = findHub(hubUrl);
+    return hd ? hd->cachedInfo : HubInfo();
+}
+
+std::vector<std::string> DCBridge::connectedHubs() {
+    std::vector<std::string> result;
+    if (!m_initialized.load()) return result;
+
+    std::lock_guard<std::mutex> lock(m_mutex);
+    for (auto& [url, data] : m_hubs) {
+        if (data.cachedInfo.connected)
+            result.push_back(url);
+    }
+    return result;
+}
+
 // =========================================================================
 // Chat
 // =========================================================================
@@ -527,6 +547,14 @@ std::vector<UserInfo> DCBridge::getHubUsers(const std::string& hubUrl) {
     return result;
 }
 
+int DCBridge::getHubUserCount(const std::string& hubUrl) {
+    if (!m_initialized.load()) return 0;
+
+    std::lock_guard<std::mutex> lock(m_mutex);
+    auto* hd = findHub(hubUrl);
+    return hd ? static_cast<int>(hd->users.size()) : 0;
+}
+
 UserInfo DCBridge::getUserInfo(const std::string& nick,
                                const std::string& hubUrl) {
     UserInfo ui;
@@ -1203,16 +1231,14 @@ std::string DCBridge::getSetting(const std::string& name) {
     return "";
 }
 
-void DCBridge::setSetting(const std::string& name,
-                          const std::string& value) {
-    if (!m_initialized.load()) return;
-
-    auto* sm = SettingsManager::getInstance();
-
+// Apply a single named setting without saving.  Returns false for
+// unknown setting names.
+static bool applySetting(SettingsManager* sm, const std::string& name,
+                         const std::string& value) {
     int n = 0;
     SettingsManager::Types type{};
     if (!sm->getType(name.c_str(), n, type))
-        return;  // unknown setting name
+        return false;
 
     if (type == SettingsManager::TYPE_STRING)
         sm->set(static_cast<SettingsManager::StrSetting>(n), value);
@@ -1221,11 +1247,34 @@ void DCBridge::setSetting(const std::string& name,
     else if (type == SettingsManager::TYPE_INT64)
         sm->set(static_cast<SettingsManager::Int64Setting>(n),
                 static_cast<int64_t>(std::atoll(value.c_str())));
+    return true;
+}
+
+void DCBridge::setSetting(const std::string& name,
+                          const std::string& value) {
+    if (!m_initialized.load()) return;
+
+    auto* sm = SettingsManager::getInstance();
+    if (!applySetting(sm, name, value))
+        return;  // unknown setting name
 
     // Save to disk so changes persist
     sm->save();
 }
 
+void DCBridge::setSettings(const std::map<std::string, std::string>& settings) {
+    if (!m_initialized.load()) return;
+
+    auto* sm = SettingsManager::getInstance();
+    bool changed = false;
+    for (const auto& [name, value] : settings)
+        changed |= applySetting(sm, name, value);
+
+    // One save for the whole batch instead of one per key
+    if (changed)
+        sm->save();
+}
+
 void DCBridge::reloadConfig() {
     if (!m_initialized.load()) return;
     SettingsManager::getInstance()->load();
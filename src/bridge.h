@@ -15,6 +15,7 @@
 
 #include <string>
 #include <vector>
+#include <map>
 #include <cstdint>
 #include <mutex>
 #include <atomic>
@@ -141,6 +142,12 @@ public:
     /// Check if connected to a specific hub.
     bool isHubConnected(const std::string& hubUrl);
 
+    /// Cached info for one hub (keyed lookup; url is empty if unknown).
+    HubInfo getHubInfo(const std::string& hubUrl);
+
+    /// URLs of all currently connected hubs (one lock, one call).
+    std::vector<std::string> connectedHubs();
+
     // =====================================================================
     // Chat
     // =====================================================================
@@ -165,6 +172,9 @@ public:
     /// Get user list for a hub.
     std::vector<UserInfo> getHubUsers(const std::string& hubUrl);
 
+    /// Number of users on a hub (without copying the user list).
+    int getHubUserCount(const std::string& hubUrl);
+
     /// Get info for a specific user.
     UserInfo getUserInfo(const std::string& nick,
                          const std::string& hubUrl);
@@ -317,6 +327,10 @@ public:
     /// Set a setting by name.
     void setSetting(const std::string& name, const std::string& value);
 
+    /// Set several settings at once, saving to disk a single time.
+    /// Unknown names are skipped, as with setSetting().
+    void setSettings(const std::map<std::string, std::string>& settings);
+
     /// Reload configuration from disk.
     void reloadConfig();
 
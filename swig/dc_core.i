@@ -16,6 +16,7 @@
 // Standard SWIG includes
 %include <std_string.i>
 %include <std_vector.i>
+%include <std_map.i>
 %include <exception.i>
 %include <stdint.i>
 
@@ -87,6 +88,7 @@ namespace std {
     %template(ShareDirVector)       vector<eiskaltdcpp_py::ShareDirInfo>;
     %template(FileListEntryVector)  vector<eiskaltdcpp_py::FileListEntry>;
     %template(TransferInfoVector)   vector<eiskaltdcpp_py::TransferInfo>;
+    %template(StringMap)            map<string, string>;
 }
 
 // ============================================================================
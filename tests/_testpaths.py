@@ -0,0 +1,73 @@
+"""
+Shared filesystem locations for the test suite.
+
+Each lookup is resolved once per process and cached, so test modules
+(and ``dc_worker.py``) can ask for the build / source directories
+without repeating ``Path.exists()`` calls at every import.
+"""
+from __future__ import annotations
+
+import functools
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@functools.cache
+def build_dir() -> Path | None:
+    """CMake output dir holding the SWIG module, or None if not built."""
+    path = REPO_ROOT / "build" / "python"
+    return path if path.exists() else None
+
+
+@functools.cache
+def python_dir() -> Path | None:
+    """Pure-Python package sources, or None if missing."""
+    path = REPO_ROOT / "python"
+    return path if path.exists() else None
+
+
+@functools.cache
+def examples_dir() -> Path | None:
+    """Bundled example Lua scripts, or None if missing."""
+    path = REPO_ROOT / "examples" / "lua"
+    return path if path.exists() else None
+
+
+def prepend_sys_path(path: Path | None) -> None:
+    """Put *path* at the front of ``sys.path`` (no-op for None).
+
+    An entry that is already present is moved to the front rather than
+    duplicated.
+    """
+    if path is None:
+        return
+    entry = str(path)
+    if sys.path and sys.path[0] == entry:
+        return
+    try:
+        sys.path.remove(entry)
+    except ValueError:
+        pass
+    sys.path.insert(0, entry)
+
+
+@functools.cache
+def swig_available() -> bool:
+    """True if the ``eiskaltdcpp`` package on sys.path ships ``_dc_core``.
+
+    Only looks for the extension file next to the package; nothing is
+    imported, so the shared library is not dlopen'd during collection.
+    Call after the test module has set up ``sys.path``.
+    """
+    spec = importlib.util.find_spec("eiskaltdcpp")
+    if spec is None or not spec.submodule_search_locations:
+        return False
+    return any(
+        (Path(loc) / f"_dc_core{suffix}").exists()
+        for loc in spec.submodule_search_locations
+        for suffix in importlib.machinery.EXTENSION_SUFFIXES
+    )
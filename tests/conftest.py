@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the API test modules.
+
+``test_client``, ``test_remote_client_integration`` and ``test_websocket``
+each build one FastAPI app per module.  They opt in to the helpers here
+with ``pytest.mark.usefixtures("reset_shared_backend")`` and import the
+credential constants from this module.
+"""
+from __future__ import annotations
+
+import pytest
+
+try:
+    import pytest_asyncio
+except ImportError:
+    pytest_asyncio = None
+
+# The admin every shared app is created with, and the read-only user
+# some modules add once; both survive reset_shared_backend.
+ADMIN_USER = "admin"
+ADMIN_PASS = "adminpass123"
+VIEWER_USER = "viewer"
+VIEWER_PASS = "viewerpass1"
+
+
+@pytest.fixture
+def reset_shared_backend(request):
+    """Undo a test's changes to the module's ``mock_dc`` and ``user_store``.
+
+    After the test, resets the mock and deletes every user except the
+    admin and viewer.  Fixtures the test never instantiated are left
+    alone, so tests that do not touch the app pay nothing.
+    """
+    yield
+    names = request.fixturenames
+    if "mock_dc" in names:
+        request.getfixturevalue("mock_dc").reset()
+    if "user_store" in names:
+        store = request.getfixturevalue("user_store")
+        for rec in store.list_users():
+            if rec.username not in (ADMIN_USER, VIEWER_USER):
+                store.delete_user(rec.username)
+
+
+if pytest_asyncio is not None:
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
+    async def http(transport):
+        """One pooled HTTP client over the module's ASGI ``transport``.
+
+        RemoteDCClient sends its token per request, so admin, read-only
+        and anonymous clients can share it; the fixture owns its
+        lifetime, so clients built on it are never closed themselves.
+        """
+        import httpx
+
+        async with httpx.AsyncClient(transport=transport,
+                                     base_url="http://testserver") as h:
+            yield h
@@ -7,6 +7,7 @@ Communicates via JSON-lines over stdin/stdout:
   - Worker replies with:  {"id": N, "ok": true, "result": ...}
                       or: {"id": N, "ok": false, "error": "..."}
   - Unsolicited events:   {"event": "...", "args": [...]}
+  - Readiness acks:       {"ready": token}  (e.g. wait_pm is being handled)
 
 The worker keeps its own asyncio event loop and DC client.  Because it
 lives in a separate process, it gets its own set of dcpp singletons,
@@ -27,9 +28,9 @@ from pathlib import Path
 from typing import Any
 
 # Locate the SWIG build dir when running from the repo checkout
-BUILD_DIR = Path(__file__).parent.parent / "build" / "python"
-if BUILD_DIR.exists():
-    sys.path.insert(0, str(BUILD_DIR))
+from _testpaths import build_dir, prepend_sys_path
+
+prepend_sys_path(build_dir())
 
 from eiskaltdcpp import AsyncDCClient
 
@@ -89,6 +90,8 @@ class DCWorker:
             return await self._cmd_disconnect(args)
         elif cmd == "set_setting":
             return self._cmd_set_setting(args)
+        elif cmd == "set_settings":
+            return self._cmd_set_settings(args)
         elif cmd == "get_setting":
             return self._cmd_get_setting(args)
         elif cmd == "is_connected":
@@ -190,6 +193,9 @@ class DCWorker:
     def _cmd_set_setting(self, args: dict) -> None:
         self.client.set_setting(args["name"], args["value"])
 
+    def _cmd_set_settings(self, args: dict) -> None:
+        self.client.set_settings(**args["settings"])
+
     def _cmd_get_setting(self, args: dict) -> str:
         return self.client.get_setting(args["name"])
 
@@ -218,9 +224,12 @@ class DCWorker:
     async def _cmd_wait_pm(self, args: dict) -> dict:
         timeout = args.get("timeout", 20)
         from_nick = args.get("from_nick")
-        pm = await self.client.wait_pm(
-            from_nick=from_nick, timeout=timeout
-        )
+        ready_token = args.get("ready_token")
+        if ready_token is not None:
+            # The client's PM queue buffers every incoming PM, so once this
+            # command is being handled the parent may send without racing.
+            self._write({"ready": ready_token})
+        pm = await self.client.wait_pm(from_nick=from_nick, timeout=timeout)
         return {
             "hub_url": pm[0],
             "from_nick": pm[1],
@@ -1143,6 +1143,17 @@ class TestUserStorePersistence:
         store.create_user("temp", "password123", UserRole.admin)
         assert store.user_count() == 1
 
+    def test_custom_password_hasher(self):
+        """An injected hasher/verifier pair replaces bcrypt."""
+        store = UserStore(
+            password_hasher=lambda p: "plain:" + p,
+            password_verifier=lambda p, h: h == "plain:" + p,
+        )
+        store.create_user("fast", "password123", UserRole.readonly)
+        assert store.get_user("fast").hashed_password == "plain:password123"
+        assert store.authenticate("fast", "password123") is not None
+        assert store.authenticate("fast", "wrong") is None
+
 
 # ============================================================================
 # Auth manager unit tests
@@ -19,6 +19,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+import pytest_asyncio
 
 from eiskaltdcpp.api.app import create_app
 from eiskaltdcpp.api.auth import AuthManager, UserStore
@@ -35,6 +36,8 @@ from eiskaltdcpp.api.client import (
 )
 from eiskaltdcpp.api.models import UserRole
 
+from conftest import ADMIN_PASS, ADMIN_USER
+
 
 # ============================================================================
 # Helpers
@@ -52,6 +55,10 @@ class MockDCClient:
     def __init__(self):
         self.is_initialized = True
         self.version = "2.4.2-test"
+        self.reset()
+
+    def reset(self):
+        """Rebuild every container with the defaults the tests expect."""
         self._hubs: list[dict] = []
         self._users: dict[str, list[dict]] = {}
         self._chat_history: dict[str, list[str]] = {}
@@ -180,44 +187,53 @@ class MockDCClient:
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
+# The app, transport and HTTP connection pool are shared by the module;
+# tests using them run on the module's event loop (loop_scope="module").
+pytestmark = pytest.mark.usefixtures("reset_shared_backend")
+
+
+@pytest.fixture(scope="module")
 def mock_dc():
     return MockDCClient()
 
 
-@pytest.fixture
-def test_app(mock_dc, tmp_path):
+@pytest.fixture(scope="module")
+def user_store(tmp_path_factory):
+    return UserStore(
+        persist_path=tmp_path_factory.mktemp("client") / "users.json")
+
+
+@pytest.fixture(scope="module")
+def test_app(mock_dc, user_store):
     """Create a FastAPI app with mock DC client."""
-    store = UserStore(persist_path=tmp_path / "users.json")
-    auth = AuthManager(user_store=store, secret_key="client-test-secret",
+    auth = AuthManager(user_store=user_store, secret_key="client-test-secret",
                        token_expire_minutes=60)
     return create_app(
         auth_manager=auth,
         dc_client=mock_dc,
-        admin_username="admin",
-        admin_password="adminpass123",
+        admin_username=ADMIN_USER,
+        admin_password=ADMIN_PASS,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def transport(test_app):
     """Create an ASGI transport for httpx testing."""
     return httpx.ASGITransport(app=test_app)
 
 
-@pytest.fixture
-async def client(transport):
+@pytest_asyncio.fixture(loop_scope="module")
+async def client(http):
     """Create a RemoteDCClient connected to the test server."""
     c = RemoteDCClient(
         "http://testserver",
-        username="admin",
-        password="adminpass123",
+        username=ADMIN_USER,
+        password=ADMIN_PASS,
     )
-    # Override the httpx client to use ASGI transport
-    c._http = httpx.AsyncClient(transport=transport, base_url="http://testserver")
-    await c.login("admin", "adminpass123")
-    yield c
-    await c.close()
+    # Inject the shared pooled client instead of letting it build its own
+    c._http = http
+    await c.login(ADMIN_USER, ADMIN_PASS)
+    return c
 
 
 # ============================================================================
@@ -562,7 +578,7 @@ class TestEventHandlers:
 class TestRemoteDCClientLogin:
     """Tests for login flow."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_login_success(self, transport):
         c = RemoteDCClient("http://testserver")
         c._http = httpx.AsyncClient(transport=transport, base_url="http://testserver")
@@ -571,7 +587,7 @@ class TestRemoteDCClientLogin:
         assert c._token == token
         await c.close()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_login_wrong_password(self, transport):
         c = RemoteDCClient("http://testserver")
         c._http = httpx.AsyncClient(transport=transport, base_url="http://testserver")
@@ -579,7 +595,7 @@ class TestRemoteDCClientLogin:
             await c.login("admin", "wrongpassword")
         await c.close()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_context_manager_auto_login(self, transport):
         c = RemoteDCClient("http://testserver",
                            username="admin", password="adminpass123")
@@ -587,7 +603,7 @@ class TestRemoteDCClientLogin:
         async with c:
             assert c._token is not None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_close_is_idempotent(self, transport):
         c = RemoteDCClient("http://testserver")
         c._http = httpx.AsyncClient(transport=transport, base_url="http://testserver")
@@ -599,12 +615,12 @@ class TestRemoteDCClientLogin:
 class TestRemoteDCClientHubs:
     """Tests for hub-related async methods."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_list_hubs_empty(self, client):
         hubs = await client.list_hubs_async()
         assert hubs == []
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_connect_and_list(self, client):
         await client.connect("dchub://test:411")
         hubs = await client.list_hubs_async()
@@ -613,20 +629,20 @@ class TestRemoteDCClientHubs:
         assert hubs[0].url == "dchub://test:411"
         assert hubs[0].connected is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_disconnect(self, client):
         await client.connect("dchub://test:411")
         await client.disconnect("dchub://test:411")
         hubs = await client.list_hubs_async()
         assert len(hubs) == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_is_connected(self, client):
         await client.connect("dchub://test:411")
         assert await client.is_connected_async("dchub://test:411") is True
         assert await client.is_connected_async("dchub://other:411") is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_multiple_hubs(self, client):
         await client.connect("dchub://hub1:411")
         await client.connect("dchub://hub2:411")
@@ -637,20 +653,20 @@ class TestRemoteDCClientHubs:
 class TestRemoteDCClientChat:
     """Tests for chat async methods."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_and_get_history(self, client):
         await client.connect("dchub://test:411")
         await client.send_message_async("dchub://test:411", "Hello world")
         history = await client.get_chat_history_async("dchub://test:411")
         assert "Hello world" in history
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_pm(self, client):
         await client.connect("dchub://test:411")
         # Should not raise
         await client.send_pm_async("dchub://test:411", "Bob", "Hi Bob")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_empty_chat_history(self, client):
         history = await client.get_chat_history_async("dchub://empty:411")
         assert history == []
@@ -659,24 +675,24 @@ class TestRemoteDCClientChat:
 class TestRemoteDCClientSearch:
     """Tests for search async methods."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_no_hubs_returns_false(self, client):
         result = await client.search_async("test query")
         # No hubs connected, mock returns False
         assert result is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_with_hub(self, client):
         await client.connect("dchub://test:411")
         result = await client.search_async("test query")
         assert result is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_search_results_empty(self, client):
         results = await client.get_search_results_async()
         assert results == []
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_clear_search_results(self, client):
         # Should not raise
         await client.clear_search_results_async()
@@ -685,7 +701,7 @@ class TestRemoteDCClientSearch:
 class TestRemoteDCClientQueue:
     """Tests for queue async methods."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_download_and_list(self, client):
         result = await client.download_async("/tmp", "file.txt", 1024, "TTH123")
         assert result is True
@@ -694,7 +710,7 @@ class TestRemoteDCClientQueue:
         assert isinstance(queue[0], QueueItemInfo)
         assert "file.txt" in queue[0].target
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_remove_download(self, client):
         await client.download_async("/tmp", "file.txt", 1024, "TTH123")
         queue = await client.list_queue_async()
@@ -703,7 +719,7 @@ class TestRemoteDCClientQueue:
         queue = await client.list_queue_async()
         assert len(queue) == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_clear_queue(self, client):
         await client.download_async("/tmp", "a.txt", 100, "T1")
         await client.download_async("/tmp", "b.txt", 200, "T2")
@@ -711,12 +727,12 @@ class TestRemoteDCClientQueue:
         queue = await client.list_queue_async()
         assert len(queue) == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_download_magnet(self, client):
         result = await client.download_magnet_async("magnet:?xt=urn:tree:tiger:ABC")
         assert result is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_empty_queue(self, client):
         queue = await client.list_queue_async()
         assert queue == []
@@ -725,7 +741,7 @@ class TestRemoteDCClientQueue:
 class TestRemoteDCClientShares:
     """Tests for share async methods."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_add_and_list_share(self, client):
         result = await client.add_share_async("/data/files", "MyFiles")
         assert result is True
@@ -733,7 +749,7 @@ class TestRemoteDCClientShares:
         assert len(shares) == 1
         assert isinstance(shares[0], ShareInfoData)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_remove_share(self, client):
         await client.add_share_async("/data/files", "MyFiles")
         result = await client.remove_share_async("/data/files")
@@ -741,12 +757,12 @@ class TestRemoteDCClientShares:
         shares = await client.list_shares_async()
         assert len(shares) == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_refresh_share(self, client):
         # Should not raise
         await client.refresh_share_async()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_empty_shares(self, client):
         shares = await client.list_shares_async()
         assert shares == []
@@ -755,27 +771,27 @@ class TestRemoteDCClientShares:
 class TestRemoteDCClientSettings:
     """Tests for settings async methods."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_setting(self, client):
         value = await client.get_setting_async("Nick")
         assert value == "TestUser"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_set_setting(self, client):
         await client.set_setting_async("Nick", "NewNick")
         value = await client.get_setting_async("Nick")
         assert value == "NewNick"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_nonexistent_setting(self, client):
         value = await client.get_setting_async("NonExistent")
         assert value == ""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_reload_config(self, client):
         await client.reload_config_async()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_start_networking(self, client):
         await client.start_networking_async()
 
@@ -783,19 +799,19 @@ class TestRemoteDCClientSettings:
 class TestRemoteDCClientStatus:
     """Tests for status async methods."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_status(self, client):
         status = await client.get_status()
         assert "version" in status
         assert "uptime_seconds" in status
         assert "connected_hubs" in status
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_health_check(self, client):
         result = await client.health_check()
         assert result is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_shutdown(self, client):
         """shutdown() sends POST /api/shutdown."""
         import os
@@ -806,13 +822,13 @@ class TestRemoteDCClientStatus:
             await client.shutdown()
             mock_kill.assert_called_once_with(os.getpid(), signal.SIGTERM)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_transfer_stats(self, client):
         stats = await client.get_transfer_stats()
         assert isinstance(stats, TransferStats)
         assert stats.download_speed >= 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_hash_status(self, client):
         hs = await client.get_hash_status()
         assert isinstance(hs, HashStatus)
@@ -821,14 +837,14 @@ class TestRemoteDCClientStatus:
 class TestRemoteDCClientUserManagement:
     """Tests for user management helpers."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_and_list_users(self, client):
         await client.create_user("newuser", "password123", "readonly")
         users = await client.list_users()
         usernames = [u["username"] for u in users]
         assert "newuser" in usernames
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_delete_user(self, client):
         await client.create_user("toremove", "pass12345", "readonly")
         await client.delete_user("toremove")
@@ -836,7 +852,7 @@ class TestRemoteDCClientUserManagement:
         usernames = [u["username"] for u in users]
         assert "toremove" not in usernames
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_update_user_role(self, client):
         await client.create_user("upgradeuser", "pass12345", "readonly")
         await client.update_user("upgradeuser", role="admin")
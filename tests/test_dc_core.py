@@ -15,15 +15,15 @@ import sys
 import tempfile
 import threading
 import uuid
-from pathlib import Path
 from typing import List
 
 import pytest
 
 # Add build directory to path for SWIG module
-BUILD_DIR = Path(__file__).parent.parent / "build" / "python"
-if BUILD_DIR.exists():
-    sys.path.insert(0, str(BUILD_DIR))
+from _testpaths import build_dir, prepend_sys_path
+
+BUILD_DIR = build_dir()
+prepend_sys_path(BUILD_DIR)
 
 # Import SWIG module
 try:
@@ -115,8 +115,9 @@ class TestDCBridgeCreation:
             "initialize", "shutdown", "isInitialized",
             "setCallback",
             "connectHub", "disconnectHub", "listHubs", "isHubConnected",
+            "getHubInfo", "connectedHubs",
             "sendMessage", "sendPM", "getChatHistory",
-            "getHubUsers", "getUserInfo",
+            "getHubUsers", "getHubUserCount", "getUserInfo",
             "search", "getSearchResults", "clearSearchResults",
             "addToQueue", "addMagnet", "removeFromQueue",
             "setPriority", "listQueue", "clearQueue",
@@ -125,7 +126,7 @@ class TestDCBridgeCreation:
             "addShareDir", "removeShareDir", "listShare",
             "refreshShare", "getShareSize", "getSharedFileCount",
             "getTransferStats", "getHashStatus", "pauseHashing",
-            "getSetting", "setSetting", "reloadConfig",
+            "getSetting", "setSetting", "setSettings", "reloadConfig",
             "getVersion",
         ]
         bridge = dc_core.DCBridge()
@@ -180,6 +181,16 @@ class TestBridgeSettings:
         val = bridge.getSetting("Description")
         assert val == "pytest-bot"
 
+    def test_set_settings_batch(self, bridge):
+        """setSettings applies every key and skips unknown names."""
+        bridge.setSettings({
+            "Description": "pytest-batch",
+            "Slots": "4",
+            "NonExistentSetting99": "x",
+        })
+        assert bridge.getSetting("Description") == "pytest-batch"
+        assert bridge.getSetting("Slots") == "4"
+
     def test_default_nick_assigned(self, bridge):
         """A default nick is generated when none is configured."""
         nick = bridge.getSetting("Nick")
@@ -23,11 +23,10 @@ Run:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import enum
 import os
-import sys
-import tempfile
 import textwrap
-from pathlib import Path
 
 import pytest
 
@@ -38,27 +37,35 @@ except ImportError:
 
 # -- Locate SWIG module ---------------------------------------------------
 # BUILD_DIR must be first so _dc_core.so is found alongside __init__.py
-BUILD_DIR = Path(__file__).parent.parent / "build" / "python"
-PYTHON_DIR = Path(__file__).parent.parent / "python"
-if PYTHON_DIR.exists():
-    sys.path.insert(0, str(PYTHON_DIR))
-if BUILD_DIR.exists():
-    sys.path.insert(0, str(BUILD_DIR))
+from _testpaths import (
+    build_dir,
+    examples_dir,
+    prepend_sys_path,
+    python_dir,
+    swig_available,
+)
 
-try:
-    from eiskaltdcpp import AsyncDCClient, DCClient
-    from eiskaltdcpp.exceptions import (
-        LuaError,
-        LuaLoadError,
-        LuaNotAvailableError,
-        LuaRuntimeError,
-        LuaSymbolError,
-    )
-    SWIG_AVAILABLE = True
-except ImportError:
-    SWIG_AVAILABLE = False
+BUILD_DIR = build_dir()
+PYTHON_DIR = python_dir()
+prepend_sys_path(PYTHON_DIR)
+prepend_sys_path(BUILD_DIR)
+
+# Pure Python — importable even without the SWIG module
+from eiskaltdcpp.exceptions import (
+    LuaError,
+    LuaLoadError,
+    LuaNotAvailableError,
+    LuaRuntimeError,
+    LuaSymbolError,
+)
+
+# Only check that the extension exists; DCClient / AsyncDCClient are
+# imported inside the fixtures that need them.  Note that the exception
+# import above still runs the package __init__, which loads the clients
+# (and _dc_core) whenever the SWIG module is built.
+SWIG_AVAILABLE = swig_available()
 
-EXAMPLES_DIR = Path(__file__).parent.parent / "examples" / "lua"
+EXAMPLES_DIR = examples_dir()
 
 # Module-level marks — skip if SWIG/pytest-asyncio not available.
 # Only network-dependent test classes use @pytest.mark.integration.
@@ -72,21 +79,128 @@ pytestmark = [
 # Fixtures
 # ============================================================================
 
-@pytest.fixture(scope="module")
+# dcpp is a per-process singleton, so the one DCClient (and its config
+# dir) lives for the whole session.
+@pytest.fixture(scope="session")
 def config_dir(tmp_path_factory):
-    """Create a temporary config directory used for all tests in this module."""
+    """Create a temporary config directory shared by the session's client."""
     return str(tmp_path_factory.mktemp("lua_integration"))
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def dc_client(config_dir):
-    """Module-scoped synchronous DCClient."""
+    """Session-scoped synchronous DCClient."""
+    from eiskaltdcpp import DCClient
+
     client = DCClient(config_dir)
     client.initialize()
     yield client
     client.shutdown()
 
 
+class LuaProbe(enum.Enum):
+    """Outcome of probing the Lua bridge once per session."""
+
+    OK = "ok"
+    NO_LUA = "Lua scripting not available in this build"
+    NO_SYMBOLS = "Lua C API symbols not resolvable at runtime"
+
+
+@pytest.fixture(scope="session")
+def _lua_probe(dc_client) -> LuaProbe:
+    """Probe Lua once on the shared client and cache the result.
+
+    Sync and async tests share it: ``AsyncDCClient`` drives the same
+    ``DCClient`` (and Lua state).  Errors other than a missing Lua or
+    unresolvable symbols propagate, so a broken bridge fails the tests.
+    """
+    if not dc_client.lua_is_available():
+        return LuaProbe.NO_LUA
+    try:
+        dc_client.lua_eval("-- probe")
+    except LuaNotAvailableError:
+        return LuaProbe.NO_LUA
+    except LuaSymbolError:
+        return LuaProbe.NO_SYMBOLS
+    return LuaProbe.OK
+
+
+@pytest.fixture
+def _lua_required(_lua_probe):
+    if _lua_probe is not LuaProbe.OK:
+        pytest.skip(_lua_probe.value)
+
+
+# Applied to the classes that evaluate Lua; only their tests request the
+# skip fixture (no autouse fixture runs for the rest of the module).
+requires_lua = pytest.mark.usefixtures("_lua_required")
+
+
+# Lua sources are dedented once at import rather than inside each test.
+_LUA_TABLE_OPS_SRC = textwrap.dedent("""\
+    local t = {1, 2, 3}
+    table.insert(t, 4)
+    assert(#t == 4)
+""")
+
+_LUA_FIB_SRC = textwrap.dedent("""\
+    local function fib(n)
+        if n <= 1 then return n end
+        return fib(n - 1) + fib(n - 2)
+    end
+    assert(fib(10) == 55)
+""")
+
+_LUA_FACTORIAL_SRC = textwrap.dedent("""\
+    local function factorial(n)
+        if n <= 1 then return 1 end
+        return n * factorial(n - 1)
+    end
+    assert(factorial(10) == 3628800, "factorial(10) should be 3628800")
+""")
+
+_LUA_GLOBALS_SRC = textwrap.dedent("""\
+    _G._integration_test_marker = "lua_integration_ok"
+    assert(_G._integration_test_marker == "lua_integration_ok")
+""")
+
+# (source, expected exception, message pattern) for failing lua_eval calls.
+_LUA_EVAL_ERROR_CASES = [
+    pytest.param("this is not valid lua!!!", LuaLoadError, None,
+                 id="syntax-error"),
+    pytest.param('error("intentional test error")', LuaRuntimeError, None,
+                 id="runtime-error"),
+    pytest.param("local x = nil; return x.foo", LuaRuntimeError, None,
+                 id="nil-index"),
+    pytest.param('error("intentional detail")', LuaError, "intentional",
+                 id="message-detail"),
+    # The LuaError catch-all also covers load errors.
+    pytest.param("@@@ bad syntax @@@", LuaError, None, id="base-class"),
+]
+
+# Read-only script files used by the eval-file tests: name -> encoded source.
+_LUA_SCRIPT_SOURCES = {
+    "simple": b'print("script executed successfully")\n',
+    "logic": _LUA_FACTORIAL_SRC.encode(),
+    "globals": _LUA_GLOBALS_SRC.encode(),
+    "bad_syntax": b"this is not valid lua!!!\n",
+    "runtime_err": b'error("deliberate runtime error")\n',
+    "async": b"assert(1 + 1 == 2)\n",
+}
+
+
+@pytest.fixture(scope="session")
+def lua_scripts(tmp_path_factory) -> dict[str, str]:
+    """Write each test script once per session; returns name -> path."""
+    root = tmp_path_factory.mktemp("lua_scripts")
+    paths = {}
+    for name, source in _LUA_SCRIPT_SOURCES.items():
+        path = root / f"test_{name}.lua"
+        path.write_bytes(source)
+        paths[name] = str(path)
+    return paths
+
+
 @pytest.fixture(scope="module")
 def event_loop():
     """Module-scoped event loop for async fixtures."""
@@ -103,6 +217,8 @@ async def async_client(dc_client):
     Instead, we build an AsyncDCClient whose internal _sync_client points at
     the existing, already-running DCClient instance.
     """
+    from eiskaltdcpp import AsyncDCClient
+
     # Create AsyncDCClient without a config_dir (we won't call initialize)
     client = AsyncDCClient()
     # Replace the internal (uninitialised) DCClient with the live one
@@ -123,24 +239,14 @@ class TestExceptionHierarchy:
     def test_base_is_runtime_error(self):
         assert issubclass(LuaError, RuntimeError)
 
-    def test_not_available_is_lua_error(self):
-        assert issubclass(LuaNotAvailableError, LuaError)
-
-    def test_symbol_error_is_lua_error(self):
-        assert issubclass(LuaSymbolError, LuaError)
-
-    def test_load_error_is_lua_error(self):
-        assert issubclass(LuaLoadError, LuaError)
-
-    def test_runtime_error_is_lua_error(self):
-        assert issubclass(LuaRuntimeError, LuaError)
-
-    def test_catching_base_catches_all(self):
-        """Catching LuaError should catch every subclass."""
-        for cls in (LuaNotAvailableError, LuaSymbolError,
-                    LuaLoadError, LuaRuntimeError):
-            with pytest.raises(LuaError):
-                raise cls("test")
+    @pytest.mark.parametrize("cls", [
+        LuaNotAvailableError, LuaSymbolError, LuaLoadError, LuaRuntimeError,
+    ])
+    def test_subclass_of_lua_error(self, cls):
+        """Every specific error is a LuaError and is caught as one."""
+        assert issubclass(cls, LuaError)
+        with pytest.raises(LuaError):
+            raise cls("test")
 
     def test_message_preserved(self):
         try:
@@ -156,35 +262,23 @@ class TestExceptionHierarchy:
 class TestLuaAvailability:
     """Test whether Lua scripting support is compiled in."""
 
-    def test_lua_is_available_returns_bool(self, dc_client):
-        result = dc_client.lua_is_available()
-        assert isinstance(result, bool)
-
-    def test_scripts_path_is_string(self, dc_client):
-        path = dc_client.lua_get_scripts_path()
-        assert isinstance(path, str)
-
-    def test_list_scripts_returns_list(self, dc_client):
-        scripts = dc_client.lua_list_scripts()
-        assert isinstance(scripts, list)
+    @pytest.mark.parametrize("method, expected_type", [
+        ("lua_is_available", bool),
+        ("lua_get_scripts_path", str),
+        ("lua_list_scripts", list),
+    ])
+    def test_method_return_type(self, dc_client, method, expected_type):
+        assert isinstance(getattr(dc_client, method)(), expected_type)
 
 
 # ============================================================================
 # Lua eval — inline code execution
 # ============================================================================
 
+@requires_lua
 class TestLuaEval:
     """Test lua_eval with various Lua code snippets."""
 
-    @pytest.fixture(autouse=True)
-    def _skip_if_no_lua(self, dc_client):
-        if not dc_client.lua_is_available():
-            pytest.skip("Lua scripting not available in this build")
-        try:
-            dc_client.lua_eval("-- probe")
-        except LuaSymbolError:
-            pytest.skip("Lua C API symbols not resolvable at runtime")
-
     def test_eval_simple_assignment(self, dc_client):
         """Assignment should succeed silently (void return)."""
         dc_client.lua_eval("_test_var = 42")
@@ -203,113 +297,56 @@ class TestLuaEval:
 
     def test_eval_table_operations(self, dc_client):
         """Table operations should work."""
-        dc_client.lua_eval(textwrap.dedent("""\
-            local t = {1, 2, 3}
-            table.insert(t, 4)
-            assert(#t == 4)
-        """))
+        dc_client.lua_eval(_LUA_TABLE_OPS_SRC)
 
     def test_eval_multiline(self, dc_client):
         """Multi-line chunks should work."""
-        code = textwrap.dedent("""\
-            local function fib(n)
-                if n <= 1 then return n end
-                return fib(n - 1) + fib(n - 2)
-            end
-            assert(fib(10) == 55)
-        """)
-        dc_client.lua_eval(code)
-
-    def test_eval_syntax_error_raises_load_error(self, dc_client):
-        """Invalid Lua syntax should raise LuaLoadError."""
-        with pytest.raises(LuaLoadError):
-            dc_client.lua_eval("this is not valid lua!!!")
-
-    def test_eval_runtime_error_raises_runtime_error(self, dc_client):
-        """Runtime errors should raise LuaRuntimeError."""
-        with pytest.raises(LuaRuntimeError):
-            dc_client.lua_eval('error("intentional test error")')
-
-    def test_eval_nil_index_raises_runtime_error(self, dc_client):
-        """Indexing nil should raise LuaRuntimeError."""
-        with pytest.raises(LuaRuntimeError):
-            dc_client.lua_eval("local x = nil; return x.foo")
+        dc_client.lua_eval(_LUA_FIB_SRC)
 
-    def test_eval_error_message_contains_detail(self, dc_client):
-        """Exception message should contain the Lua error detail."""
-        with pytest.raises(LuaError, match="intentional"):
-            dc_client.lua_eval('error("intentional detail")')
-
-    def test_eval_catches_base_class(self, dc_client):
-        """LuaError catch-all should work for load errors too."""
-        with pytest.raises(LuaError):
-            dc_client.lua_eval("@@@ bad syntax @@@")
+    @pytest.mark.parametrize("src, expected_exc, match", _LUA_EVAL_ERROR_CASES)
+    def test_eval_raises(self, dc_client, src, expected_exc, match):
+        """Failing chunks raise the matching typed LuaError subclass."""
+        with pytest.raises(expected_exc, match=match):
+            dc_client.lua_eval(src)
 
 
 # ============================================================================
 # Lua eval-file — script file execution
 # ============================================================================
 
+@requires_lua
 class TestLuaEvalFile:
     """Test lua_eval_file with actual script files."""
 
-    @pytest.fixture(autouse=True)
-    def _skip_if_no_lua(self, dc_client):
-        if not dc_client.lua_is_available():
-            pytest.skip("Lua scripting not available in this build")
-        try:
-            dc_client.lua_eval("-- probe")
-        except LuaSymbolError:
-            pytest.skip("Lua C API symbols not resolvable at runtime")
-
-    def test_eval_simple_script(self, dc_client, tmp_path):
+    def test_eval_simple_script(self, dc_client, lua_scripts):
         """Execute a trivial script file."""
-        script = tmp_path / "test_simple.lua"
-        script.write_text('print("script executed successfully")\n')
-        dc_client.lua_eval_file(str(script))
+        dc_client.lua_eval_file(lua_scripts["simple"])
 
-    def test_eval_script_with_logic(self, dc_client, tmp_path):
+    def test_eval_script_with_logic(self, dc_client, lua_scripts):
         """Execute a script with actual logic."""
-        script = tmp_path / "test_logic.lua"
-        script.write_text(textwrap.dedent("""\
-            local function factorial(n)
-                if n <= 1 then return 1 end
-                return n * factorial(n - 1)
-            end
-            assert(factorial(10) == 3628800, "factorial(10) should be 3628800")
-        """))
-        dc_client.lua_eval_file(str(script))
-
-    def test_eval_script_with_globals(self, dc_client, tmp_path):
+        dc_client.lua_eval_file(lua_scripts["logic"])
+
+    def test_eval_script_with_globals(self, dc_client, lua_scripts):
         """Script can set and read global variables."""
-        script = tmp_path / "test_globals.lua"
-        script.write_text(textwrap.dedent("""\
-            _G._integration_test_marker = "lua_integration_ok"
-            assert(_G._integration_test_marker == "lua_integration_ok")
-        """))
-        dc_client.lua_eval_file(str(script))
+        dc_client.lua_eval_file(lua_scripts["globals"])
 
     def test_eval_nonexistent_file_raises(self, dc_client):
         """Attempting to eval a nonexistent file should raise."""
         with pytest.raises(LuaError):
             dc_client.lua_eval_file("/nonexistent/path/to/script.lua")
 
-    def test_eval_file_with_syntax_error(self, dc_client, tmp_path):
+    def test_eval_file_with_syntax_error(self, dc_client, lua_scripts):
         """A script with syntax errors should raise LuaLoadError."""
-        script = tmp_path / "test_bad_syntax.lua"
-        script.write_text("this is not valid lua!!!\n")
         with pytest.raises(LuaLoadError):
-            dc_client.lua_eval_file(str(script))
+            dc_client.lua_eval_file(lua_scripts["bad_syntax"])
 
-    def test_eval_file_with_runtime_error(self, dc_client, tmp_path):
+    def test_eval_file_with_runtime_error(self, dc_client, lua_scripts):
         """A script that errors at runtime should raise LuaRuntimeError."""
-        script = tmp_path / "test_runtime_err.lua"
-        script.write_text('error("deliberate runtime error")\n')
         with pytest.raises(LuaRuntimeError):
-            dc_client.lua_eval_file(str(script))
+            dc_client.lua_eval_file(lua_scripts["runtime_err"])
 
     @pytest.mark.skipif(
-        not EXAMPLES_DIR.exists(),
+        EXAMPLES_DIR is None,
         reason="examples/lua directory not found",
     )
     def test_eval_example_chat_commands(self, dc_client):
@@ -330,7 +367,7 @@ class TestLuaEvalFile:
             assert "nil" in str(exc).lower() or "dcpp" in str(exc).lower()
 
     @pytest.mark.skipif(
-        not EXAMPLES_DIR.exists(),
+        EXAMPLES_DIR is None,
         reason="examples/lua directory not found",
     )
     def test_eval_example_auto_greet(self, dc_client):
@@ -352,18 +389,10 @@ class TestLuaEvalFile:
 # Async client — same operations through AsyncDCClient
 # ============================================================================
 
+@requires_lua
 class TestAsyncLuaEval:
     """Verify the async wrapper passes through correctly."""
 
-    @pytest.fixture(autouse=True)
-    def _skip_if_no_lua(self, async_client):
-        if not async_client.lua_is_available():
-            pytest.skip("Lua scripting not available in this build")
-        try:
-            async_client.lua_eval("-- probe")
-        except (LuaSymbolError, LuaError):
-            pytest.skip("Lua eval not functional in this environment")
-
     @pytest.mark.asyncio
     async def test_async_eval_success(self, async_client):
         async_client.lua_eval('print("async eval ok")')
@@ -374,10 +403,8 @@ class TestAsyncLuaEval:
             async_client.lua_eval('error("async test error")')
 
     @pytest.mark.asyncio
-    async def test_async_eval_file(self, async_client, tmp_path):
-        script = tmp_path / "async_test.lua"
-        script.write_text('assert(1 + 1 == 2)\n')
-        async_client.lua_eval_file(str(script))
+    async def test_async_eval_file(self, async_client, lua_scripts):
+        async_client.lua_eval_file(lua_scripts["async"])
 
 
 # ============================================================================
@@ -389,6 +416,19 @@ HUB_URL = os.environ.get(
 )
 
 
+async def _wait_for(pred, timeout: float = 5.0, interval: float = 0.05):
+    """Poll *pred* until it returns a truthy value and return that value.
+
+    Returns the last (falsy) result if *timeout* elapses first, so the
+    caller's assertion reports what was actually observed.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not (result := pred()) and loop.time() < deadline:
+        await asyncio.sleep(interval)
+    return result
+
+
 class TestTLSEncryption:
     """Verify TLS encryption fields are populated on hub connections.
 
@@ -411,13 +451,12 @@ class TestTLSEncryption:
         await async_client.connect(HUB_URL)
         try:
             await async_client.wait_connected(HUB_URL, timeout=30)
-            # Give the cipher info a moment to propagate
-            await asyncio.sleep(2)
-
-            hubs = async_client.list_hubs()
-            assert len(hubs) > 0, "Should have at least one hub"
-
-            hub = next((h for h in hubs if HUB_URL in h.url), None)
+            # The cipher name lands in the hub cache shortly after connect.
+            await _wait_for(
+                lambda: getattr(async_client.get_hub(HUB_URL),
+                                "cipherName", "")
+            )
+            hub = async_client.get_hub(HUB_URL)
             assert hub is not None, f"Hub {HUB_URL} not found in list"
 
             # nmdcs:// should always be secure
@@ -425,4 +464,5 @@ class TestTLSEncryption:
             assert hub.cipherName, f"Expected non-empty cipherName for {HUB_URL}"
         finally:
             await async_client.disconnect(HUB_URL)
-            await asyncio.sleep(1)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await async_client.wait_disconnected(HUB_URL)
@@ -11,13 +11,23 @@ the actual API routes and auth flow rather than mocking httpx calls.
 
 Run:
     PYTHONPATH=build/python pytest tests/test_remote_client_integration.py -v
+
+Each test class is its own ``xdist_group``, so with pytest-xdist the
+classes can run on separate workers while each class stays on one:
+    pytest tests/test_remote_client_integration.py -n auto --dist=loadgroup
 """
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import hmac
+import itertools
+from collections import deque
+from types import SimpleNamespace
 
 import httpx
 import pytest
+import pytest_asyncio
 
 from eiskaltdcpp.api.app import create_app
 from eiskaltdcpp.api.auth import AuthManager, UserStore
@@ -32,116 +42,141 @@ from eiskaltdcpp.api.client import (
     UserInfo,
 )
 
+from conftest import ADMIN_PASS, ADMIN_USER, VIEWER_PASS, VIEWER_USER
+
 # ============================================================================
 # Mock DC client — mirrors the one in test_client.py
 # ============================================================================
 
+BUSY_HUB = "dchub://busy:411"
+
+# Read-only backend payloads, built once at import time.
+ALICE = SimpleNamespace(nick="Alice", shareSize=100, description="", tag="",
+                        connection="", email="", hubUrl=BUSY_HUB)
+BOB = SimpleNamespace(nick="Bob", shareSize=200, description="", tag="",
+                      connection="", email="", hubUrl=BUSY_HUB)
 
-class _Obj:
-    """Dict → attribute-access wrapper."""
+# Per-hub chat lines kept by the mock (bounded, like the bridge's buffer).
+_CHAT_HISTORY_MAX = 1000
 
-    def __init__(self, d: dict):
-        self.__dict__.update(d)
+_TRANSFER_STATS = SimpleNamespace(downloadSpeed=4096, uploadSpeed=2048,
+                                  downloaded=2097152, uploaded=1048576)
 
 
 class MockDCClient:
-    """Minimal mock that satisfies all route handlers."""
+    """Minimal mock that satisfies all route handlers.
+
+    Rows are stored as ``SimpleNamespace`` objects, the shape route
+    handlers read from the real bridge, so ``list_*`` calls hand back
+    the stored objects without wrapping them again.
+    """
 
     def __init__(self):
         self.is_initialized = True
         self.version = "2.4.2-integ"
-        self._hubs: list[dict] = []
-        self._users: dict[str, list[dict]] = {}
-        self._chat_history: dict[str, list[str]] = {}
-        self._search_results: list[dict] = []
-        self._queue: list[dict] = []
-        self._shares: list[dict] = []
+        self.reset()
+
+    def reset(self):
+        """Start over with no hubs, queue or shares and default settings."""
+        self._hubs: dict[str, SimpleNamespace] = {}
+        self._users: dict[str, list[SimpleNamespace]] = {}
+        self._chat_history: dict[str, deque[str]] = {}
+        self._search_results: list[SimpleNamespace] = []
+        self._queue: list[SimpleNamespace] = []
+        self._shares: list[SimpleNamespace] = []
         self._settings: dict[str, str] = {"Nick": "TestBot"}
         self._share_size = 2_000_000_000
         self._shared_files = 99
-        self._hashing_paused = False
+        self._hash_status = SimpleNamespace(currentFile="/data/video.mkv",
+                                            filesLeft=7, bytesLeft=5_000_000,
+                                            isPaused=False)
 
     # -- Hubs --
     async def connect(self, url, encoding=""):
-        self._hubs.append({"url": url, "name": f"Hub-{url}",
-                           "connected": True, "userCount": 3})
+        self._hubs[url] = SimpleNamespace(url=url, name=f"Hub-{url}",
+                                          connected=True, userCount=3)
 
     async def disconnect(self, url):
-        self._hubs = [h for h in self._hubs if h["url"] != url]
+        self._hubs.pop(url, None)
 
     def list_hubs(self):
-        return [_Obj(h) for h in self._hubs]
+        return list(self._hubs.values())
 
     def is_connected(self, url):
-        return any(h["url"] == url for h in self._hubs)
+        return url in self._hubs
 
     # -- Chat --
     def send_message(self, hub_url, message):
-        self._chat_history.setdefault(hub_url, []).append(message)
+        self._chat_history.setdefault(
+            hub_url, deque(maxlen=_CHAT_HISTORY_MAX)).append(message)
 
     def send_pm(self, hub_url, nick, message):
         pass
 
     def get_chat_history(self, hub_url, max_lines=100):
-        return self._chat_history.get(hub_url, [])[:max_lines]
+        return list(itertools.islice(self._chat_history.get(hub_url, ()),
+                                     max_lines))
 
     def get_users(self, hub_url):
-        return [_Obj(u) for u in self._users.get(hub_url, [])]
+        return self._users.get(hub_url, [])
 
     # -- Search --
     def search(self, query, file_type=0, size_mode=0, size=0, hub_url=""):
-        self._search_results.append({
-            "hubUrl": hub_url or "test", "file": f"result-{query}.txt",
-            "size": 12345, "freeSlots": 2, "totalSlots": 4,
-            "tth": "AAAA", "nick": "Uploader", "isDirectory": False,
-        })
+        self._search_results.append(SimpleNamespace(
+            hubUrl=hub_url or "test", file=f"result-{query}.txt",
+            size=12345, freeSlots=2, totalSlots=4,
+            tth="AAAA", nick="Uploader", isDirectory=False,
+        ))
         return True
 
     def get_search_results(self, hub_url=""):
-        return [_Obj(r) for r in self._search_results]
+        return self._search_results
 
     def clear_search_results(self, hub_url=""):
         self._search_results.clear()
 
     # -- Queue --
     def download(self, directory, name, size, tth, hub_url="", nick=""):
-        self._queue.append({"target": f"{directory}/{name}", "size": size,
-                            "downloadedBytes": 0, "priority": 3, "tth": tth})
+        self._queue.append(SimpleNamespace(
+            target=f"{directory}/{name}", size=size,
+            downloadedBytes=0, priority=3, tth=tth,
+        ))
         return True
 
     def download_magnet(self, magnet, download_dir=""):
-        self._queue.append({"target": f"{download_dir}/magnet-dl",
-                            "size": 0, "downloadedBytes": 0,
-                            "priority": 3, "tth": ""})
+        self._queue.append(SimpleNamespace(
+            target=f"{download_dir}/magnet-dl", size=0,
+            downloadedBytes=0, priority=3, tth="",
+        ))
         return True
 
     def remove_download(self, target):
-        self._queue = [q for q in self._queue if q["target"] != target]
+        self._queue = [q for q in self._queue if q.target != target]
 
     def list_queue(self):
-        return [_Obj(q) for q in self._queue]
+        return self._queue
 
     def clear_queue(self):
         self._queue.clear()
 
     def set_priority(self, target, priority):
         for q in self._queue:
-            if q["target"] == target:
-                q["priority"] = priority
+            if q.target == target:
+                q.priority = priority
 
     # -- Shares --
     def add_share(self, real_path, virtual_name):
-        self._shares.append({"realPath": real_path,
-                             "virtualName": virtual_name, "size": 0})
+        self._shares.append(SimpleNamespace(realPath=real_path,
+                                            virtualName=virtual_name, size=0))
         return True
 
     def remove_share(self, real_path):
         before = len(self._shares)
-        self._shares = [s for s in self._shares if s["realPath"] != real_path]
+        self._shares = [s for s in self._shares if s.realPath != real_path]
         return len(self._shares) < before
 
     def list_shares(self):
-        return [_Obj(s) for s in self._shares]
+        return self._shares
 
     def refresh_share(self):
         pass
@@ -170,17 +205,18 @@ class MockDCClient:
     # -- Transfers & Hashing --
     @property
     def transfer_stats(self):
-        return _Obj({"downloadSpeed": 4096, "uploadSpeed": 2048,
-                     "downloaded": 2097152, "uploaded": 1048576})
+        return _TRANSFER_STATS
 
     @property
     def hash_status(self):
-        return _Obj({"currentFile": "/data/video.mkv",
-                     "filesLeft": 7, "bytesLeft": 5_000_000,
-                     "isPaused": self._hashing_paused})
+        return self._hash_status
+
+    @property
+    def _hashing_paused(self):
+        return self._hash_status.isPaused
 
     def pause_hashing(self, pause=True):
-        self._hashing_paused = pause
+        self._hash_status.isPaused = pause
 
     @property
     def _sync_client(self):
@@ -191,20 +227,40 @@ class MockDCClient:
 # Fixtures
 # ============================================================================
 
-ADMIN_USER = "integadmin"
-ADMIN_PASS = "integpass123"
+# The app, transport and logged-in clients are shared by the whole module
+# so the bcrypt login round-trip runs once per client instead of per test;
+# tests therefore also share the module's event loop.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.usefixtures("reset_shared_backend"),
+]
 
 
-@pytest.fixture
+def _fast_hash(password: str) -> str:
+    """Test-only password hash: unsalted SHA-256 instead of bcrypt."""
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def _fast_verify(password: str, hashed: str) -> bool:
+    return hmac.compare_digest(_fast_hash(password), hashed)
+
+
+@pytest.fixture(scope="module")
 def mock_dc():
     return MockDCClient()
 
 
-@pytest.fixture
-def app(mock_dc, tmp_path):
+@pytest.fixture(scope="module")
+def user_store():
+    """In-memory user store (no ``persist_path``) with the fast hasher."""
+    return UserStore(password_hasher=_fast_hash,
+                     password_verifier=_fast_verify)
+
+
+@pytest.fixture(scope="module")
+def app(mock_dc, user_store):
     """Full FastAPI app with mock DC backend."""
-    store = UserStore(persist_path=tmp_path / "users.json")
-    auth = AuthManager(user_store=store, secret_key="integ-test-key",
+    auth = AuthManager(user_store=user_store, secret_key="integ-test-key",
                        token_expire_minutes=60)
     return create_app(
         auth_manager=auth,
@@ -214,42 +270,39 @@ def app(mock_dc, tmp_path):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def transport(app):
     return httpx.ASGITransport(app=app)
 
 
-@pytest.fixture
-async def client(transport) -> RemoteDCClient:
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(http) -> RemoteDCClient:
     """Authenticated RemoteDCClient talking to the in-process server."""
     c = RemoteDCClient("http://testserver",
                        username=ADMIN_USER, password=ADMIN_PASS)
-    c._http = httpx.AsyncClient(transport=transport,
-                                base_url="http://testserver")
+    c._http = http
     await c.login(ADMIN_USER, ADMIN_PASS)
-    yield c
-    await c.close()
+    return c
 
 
-@pytest.fixture
-async def readonly_client(transport, client) -> RemoteDCClient:
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def readonly_client(http, client) -> RemoteDCClient:
     """A read-only client for RBAC tests."""
     # Use the admin client to create a readonly user
-    await client.create_user("viewer", "viewerpass1", "readonly")
+    await client.create_user(VIEWER_USER, VIEWER_PASS, "readonly")
 
     c = RemoteDCClient("http://testserver",
-                       username="viewer", password="viewerpass1")
-    c._http = httpx.AsyncClient(transport=transport,
-                                base_url="http://testserver")
-    await c.login("viewer", "viewerpass1")
-    yield c
-    await c.close()
+                       username=VIEWER_USER, password=VIEWER_PASS)
+    c._http = http
+    await c.login(VIEWER_USER, VIEWER_PASS)
+    return c
 
 
 # ============================================================================
 # Auth integration
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_auth")
 class TestAuthIntegration:
     """Login, token usage, and user management round-trips."""
 
@@ -257,13 +310,11 @@ class TestAuthIntegration:
         assert client._token is not None
         assert len(client._token) > 20
 
-    async def test_login_bad_password_raises(self, transport):
+    async def test_login_bad_password_raises(self, http):
         c = RemoteDCClient("http://testserver")
-        c._http = httpx.AsyncClient(transport=transport,
-                                    base_url="http://testserver")
+        c._http = http
         with pytest.raises(httpx.HTTPStatusError):
             await c.login(ADMIN_USER, "wrongwrong")
-        await c.close()
 
     async def test_create_list_delete_user(self, client):
         await client.create_user("ephemeral", "ephemeral1", "readonly")
@@ -287,6 +338,7 @@ class TestAuthIntegration:
 # Hub operations
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_hub")
 class TestHubIntegration:
     """Connect, disconnect, list hubs via RemoteDCClient."""
 
@@ -317,15 +369,9 @@ class TestHubIntegration:
         assert users == []
 
     async def test_list_users_populated(self, client, mock_dc):
-        hub = "dchub://busy:411"
-        await client.connect(hub)
-        mock_dc._users[hub] = [
-            {"nick": "Alice", "shareSize": 100, "description": "",
-             "tag": "", "connection": "", "email": "", "hubUrl": hub},
-            {"nick": "Bob", "shareSize": 200, "description": "",
-             "tag": "", "connection": "", "email": "", "hubUrl": hub},
-        ]
-        users = await client.get_users_async(hub)
+        await client.connect(BUSY_HUB)
+        mock_dc._users[BUSY_HUB] = [ALICE, BOB]
+        users = await client.get_users_async(BUSY_HUB)
         assert len(users) == 2
         assert isinstance(users[0], UserInfo)
         nicks = {u.nick for u in users}
@@ -336,6 +382,7 @@ class TestHubIntegration:
 # Chat operations
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_chat")
 class TestChatIntegration:
     """Send messages and retrieve history."""
 
@@ -360,6 +407,7 @@ class TestChatIntegration:
 # Search operations
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_search")
 class TestSearchIntegration:
     """Search, get results, clear results."""
 
@@ -390,6 +438,7 @@ class TestSearchIntegration:
 # Queue operations
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_queue")
 class TestQueueIntegration:
     """Download queue management round-trips."""
 
@@ -441,6 +490,7 @@ class TestQueueIntegration:
 # Share operations
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_share")
 class TestShareIntegration:
     """Share directory management round-trips."""
 
@@ -480,6 +530,7 @@ class TestShareIntegration:
 # Settings operations
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_settings")
 class TestSettingsIntegration:
     """Get/set settings, reload, networking."""
 
@@ -503,6 +554,7 @@ class TestSettingsIntegration:
 # Transfer & hashing status
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_transfers")
 class TestTransfersIntegration:
     """Transfer stats and hashing status round-trips."""
 
@@ -528,6 +580,7 @@ class TestTransfersIntegration:
 # System status
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_status")
 class TestStatusIntegration:
     """Status and health endpoints."""
 
@@ -544,6 +597,7 @@ class TestStatusIntegration:
 # RBAC — readonly client should be denied on write endpoints
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_rbac")
 class TestRBACIntegration:
     """Read-only users cannot call write endpoints."""
 
@@ -551,23 +605,20 @@ class TestRBACIntegration:
         hubs = await readonly_client.list_hubs_async()
         assert isinstance(hubs, list)
 
-    async def test_readonly_cannot_connect(self, readonly_client):
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await readonly_client.connect("dchub://nope:411")
-        assert exc_info.value.response.status_code == 403
-
-    async def test_readonly_cannot_send_chat(self, readonly_client, mock_dc):
-        with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await readonly_client.send_message_async("dchub://x:411", "hi")
-        assert exc_info.value.response.status_code == 403
-
     async def test_readonly_can_get_status(self, readonly_client):
         status = await readonly_client.get_status()
         assert "version" in status
 
-    async def test_readonly_cannot_create_users(self, readonly_client):
+    @pytest.mark.parametrize("call", [
+        pytest.param(lambda c: c.connect("dchub://nope:411"), id="connect"),
+        pytest.param(lambda c: c.send_message_async("dchub://x:411", "hi"),
+                     id="send_chat"),
+        pytest.param(lambda c: c.create_user("hacker", "hacker123", "admin"),
+                     id="create_user"),
+    ])
+    async def test_readonly_denied(self, readonly_client, call):
         with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            await readonly_client.create_user("hacker", "hacker123", "admin")
+            await call(readonly_client)
         assert exc_info.value.response.status_code == 403
 
 
@@ -575,6 +626,7 @@ class TestRBACIntegration:
 # Context manager
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_context_manager")
 class TestContextManagerIntegration:
     """async with RemoteDCClient(...) usage."""
 
@@ -597,6 +649,7 @@ class TestContextManagerIntegration:
 # Event handler registration
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_event_handlers")
 class TestEventHandlersIntegration:
     """on() / off() handler registration."""
 
@@ -618,6 +671,7 @@ class TestEventHandlersIntegration:
 # Full workflow — multi-step scenario
 # ============================================================================
 
+@pytest.mark.xdist_group(name="remote_workflow")
 class TestFullWorkflow:
     """End-to-end scenario: login → connect → chat → search → queue."""
 
@@ -7,20 +7,25 @@ Covers:
 - ConnectionManager: connect, disconnect, broadcast, send_personal
 - WebSocket endpoint: auth, subscribe/unsubscribe, ping/pong
 - Event bridge (start/stop)
+
+In-process classes are grouped apart from the TestClient-driven endpoint
+tests, so pytest-xdist can run the two groups on separate workers:
+    pytest tests/test_websocket.py -n auto --dist=loadgroup
 """
 from __future__ import annotations
 
 import asyncio
 import json
 import time
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from unittest.mock import patch
 
+import bcrypt
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from starlette.testclient import TestClient as _StarletteClient
 from starlette.websockets import WebSocketState
 
+from eiskaltdcpp.api import websocket as websocket_mod
 from eiskaltdcpp.api.app import create_app
 from eiskaltdcpp.api.auth import AuthManager, UserRecord, UserStore
 from eiskaltdcpp.api.models import UserRole
@@ -30,22 +35,79 @@ from eiskaltdcpp.api.websocket import (
     Channel,
     ConnectionManager,
     _ClientConnection,
+    _dumps,
+    _handle_client_message,
+    _parse_channels,
     _serialize_event,
     ws_manager,
 )
 
+from conftest import ADMIN_PASS, ADMIN_USER, VIEWER_PASS, VIEWER_USER
+
+
+# Event names for the per-event mapping tests, computed at collection.
+_EVENTS = tuple(EVENT_ARG_NAMES)
+_MAPPED_EVENTS = tuple(EVENT_CHANNELS)
+
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
-class _DictObj:
-    def __init__(self, d: dict):
-        self.__dict__.update(d)
+# Row shapes the route handlers read off the mock (camelCase like the bridge).
+@dataclass(slots=True)
+class _HubRow:
+    url: str
+    name: str
+    connected: bool = True
+    userCount: int = 0
+
+
+@dataclass(slots=True)
+class _QueueRow:
+    target: str
+    size: int
+    tth: str
+    downloadedBytes: int = 0
+    priority: int = 3
+
+
+@dataclass(slots=True)
+class _ShareRow:
+    realPath: str
+    virtualName: str
+    size: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _TransferStats:
+    downloadSpeed: int
+    uploadSpeed: int
+    downloaded: int
+    uploaded: int
+
+
+@dataclass(frozen=True, slots=True)
+class _HashStatus:
+    currentFile: str
+    filesLeft: int
+    bytesLeft: int
+    isPaused: bool
+
+
+# The mock reports fixed transfer/hash figures; build them once.
+_TRANSFER_STATS = _TransferStats(downloadSpeed=100, uploadSpeed=50,
+                                 downloaded=0, uploaded=0)
+_HASH_STATUS = _HashStatus(currentFile="", filesLeft=0, bytesLeft=0,
+                           isPaused=False)
 
 
 class MockDCClient:
-    """Minimal mock for WebSocket tests."""
+    """Minimal mock for WebSocket tests.
+
+    Rows are stored as slotted row objects, so the ``list_*`` calls made
+    by routes and the status broadcaster only copy the list.
+    """
 
     def __init__(self):
         self.is_initialized = True
@@ -61,20 +123,31 @@ class MockDCClient:
         self._chat_history = {}
         self._users = {}
 
+    def reset(self):
+        """Empty the mutable state in place (the mock is shared per module)."""
+        self._hubs.clear()
+        self._queue.clear()
+        self._shares.clear()
+        self._search_results.clear()
+        self._chat_history.clear()
+        self._users.clear()
+        self._settings.clear()
+        self._hashing_paused = False
+
     async def connect(self, url, encoding=""):
-        self._hubs.append({"url": url, "name": url, "connected": True, "userCount": 0})
+        self._hubs.append(_HubRow(url=url, name=url))
 
     async def disconnect(self, url):
-        self._hubs = [h for h in self._hubs if h["url"] != url]
+        self._hubs = [h for h in self._hubs if h.url != url]
 
     def list_hubs(self):
-        return [_DictObj(h) for h in self._hubs]
+        return list(self._hubs)
 
     def is_connected(self, url):
-        return any(h["url"] == url for h in self._hubs)
+        return any(h.url == url for h in self._hubs)
 
     def list_queue(self):
-        return [_DictObj(q) for q in self._queue]
+        return list(self._queue)
 
     @property
     def share_size(self):
@@ -86,13 +159,11 @@ class MockDCClient:
 
     @property
     def transfer_stats(self):
-        return _DictObj({"downloadSpeed": 100, "uploadSpeed": 50,
-                         "downloaded": 0, "uploaded": 0})
+        return _TRANSFER_STATS
 
     @property
     def hash_status(self):
-        return _DictObj({"currentFile": "", "filesLeft": 0,
-                         "bytesLeft": 0, "isPaused": False})
+        return _HASH_STATUS
 
     def send_message(self, hub_url, message):
         self._chat_history.setdefault(hub_url, []).append(message)
@@ -104,41 +175,42 @@ class MockDCClient:
         return self._chat_history.get(hub_url, [])[:max_lines]
 
     def get_users(self, hub_url):
-        return [_DictObj(u) for u in self._users.get(hub_url, [])]
+        return list(self._users.get(hub_url, ()))
 
     def search(self, query, file_type=0, size_mode=0, size=0, hub_url=""):
         return len(self._hubs) > 0
 
     def get_search_results(self, hub_url=""):
-        return [_DictObj(r) for r in self._search_results]
+        return list(self._search_results)
 
     def clear_search_results(self, hub_url=""):
         self._search_results.clear()
 
     def download(self, directory, name, size, tth, hub_url="", nick=""):
-        self._queue.append({"target": f"{directory}/{name}", "size": size,
-                            "downloadedBytes": 0, "priority": 3, "tth": tth})
+        self._queue.append(_QueueRow(target=f"{directory}/{name}",
+                                     size=size, tth=tth))
         return True
 
     def download_magnet(self, magnet, download_dir=""):
         return True
 
     def remove_download(self, target):
-        self._queue = [q for q in self._queue if q["target"] != target]
+        self._queue = [q for q in self._queue if q.target != target]
 
     def clear_queue(self):
         self._queue.clear()
 
     def add_share(self, real_path, virtual_name):
-        self._shares.append({"realPath": real_path, "virtualName": virtual_name, "size": 0})
+        self._shares.append(_ShareRow(realPath=real_path,
+                                      virtualName=virtual_name))
         return True
 
     def remove_share(self, real_path):
-        self._shares = [s for s in self._shares if s["realPath"] != real_path]
+        self._shares = [s for s in self._shares if s.realPath != real_path]
         return True
 
     def list_shares(self):
-        return [_DictObj(s) for s in self._shares]
+        return list(self._shares)
 
     def refresh_share(self):
         pass
@@ -154,8 +226,8 @@ class MockDCClient:
 
     def set_priority(self, target, priority):
         for q in self._queue:
-            if q["target"] == target:
-                q["priority"] = priority
+            if q.target == target:
+                q.priority = priority
 
     def reload_config(self):
         pass
@@ -168,17 +240,31 @@ class MockDCClient:
         return self
 
 
-@pytest.fixture
-def mock_client():
+# The app and its backing objects are shared by the whole module so the
+# FastAPI app (and the admin's bcrypt hash) is built once. Tests must not
+# leave state behind on them: reset_shared_backend restores the mock and the
+# user store after each test.
+pytestmark = pytest.mark.usefixtures("reset_shared_backend")
+
+
+@pytest.fixture(scope="module")
+def mock_dc():
     return MockDCClient()
 
 
-@pytest.fixture
-def user_store(tmp_path):
-    return UserStore(persist_path=tmp_path / "users.json")
+def _low_cost_bcrypt(password: str) -> str:
+    """Real bcrypt at the minimum cost (4) — test-only; verify is unchanged."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=4)).decode()
+
 
+@pytest.fixture(scope="module")
+def user_store():
+    # No persist_path: the store stays in memory (persistence is covered
+    # by TestUserStorePersistence in test_api.py).
+    return UserStore(password_hasher=_low_cost_bcrypt)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def auth_manager(user_store):
     return AuthManager(
         user_store=user_store,
@@ -187,86 +273,79 @@ def auth_manager(user_store):
     )
 
 
-@pytest.fixture
-def app(mock_client, auth_manager):
+@pytest.fixture(scope="module")
+def app(mock_dc, auth_manager):
     application = create_app(
         auth_manager=auth_manager,
-        dc_client=mock_client,
-        admin_username="admin",
-        admin_password="adminpass123",
+        dc_client=mock_dc,
+        admin_username=ADMIN_USER,
+        admin_password=ADMIN_PASS,
     )
-    return TestClient(application)
+    # Entering the client starts its blocking portal (event loop thread)
+    # once; every request and websocket_connect in the module reuses it
+    # instead of spinning up a fresh portal per call.
+    with TestClient(application) as client:
+        yield client
 
 
-@pytest.fixture
-def admin_token(app):
-    resp = app.post("/api/auth/login", json={
-        "username": "admin",
-        "password": "adminpass123",
-    })
-    assert resp.status_code == 200
-    return resp.json()["access_token"]
+# Tokens are minted directly rather than via POST /api/auth/login, which
+# would bcrypt-verify the password; test_ws_connect_after_http_login keeps
+# the HTTP login path covered.
+@pytest.fixture(scope="module")
+def admin_token(app, auth_manager):
+    token, _ = auth_manager.create_token(ADMIN_USER, UserRole.admin)
+    return token
 
 
-@pytest.fixture
-def readonly_token(app, admin_token):
-    app.post(
-        "/api/auth/users",
-        json={"username": "viewer", "password": "viewerpass1", "role": "readonly"},
-        headers={"Authorization": f"Bearer {admin_token}"},
-    )
-    resp = app.post("/api/auth/login", json={
-        "username": "viewer",
-        "password": "viewerpass1",
-    })
-    assert resp.status_code == 200
-    return resp.json()["access_token"]
+@pytest.fixture(scope="module")
+def readonly_token(user_store, auth_manager):
+    user_store.create_user(VIEWER_USER, VIEWER_PASS, UserRole.readonly)
+    token, _ = auth_manager.create_token(VIEWER_USER, UserRole.readonly)
+    return token
 
 
 # ============================================================================
 # Unit tests: Channel enum
 # ============================================================================
 
+_CHANNEL_NAMES = ("events", "chat", "search", "transfers", "hubs", "status")
+
+
+@pytest.mark.xdist_group(name="ws_inproc")
 class TestChannelEnum:
     """Tests for the Channel enum."""
 
-    def test_channel_values(self):
-        assert Channel.events == "events"
-        assert Channel.chat == "chat"
-        assert Channel.search == "search"
-        assert Channel.transfers == "transfers"
-        assert Channel.hubs == "hubs"
-        assert Channel.status == "status"
-
-    def test_channel_from_string(self):
-        assert Channel("events") == Channel.events
-        assert Channel("chat") == Channel.chat
+    @pytest.mark.parametrize("name", _CHANNEL_NAMES)
+    def test_channel(self, name):
+        assert Channel(name) is Channel[name]
+        assert Channel(name) == name
 
     def test_channel_invalid_raises(self):
         with pytest.raises(ValueError):
             Channel("invalid_channel")
 
-    def test_all_channels_count(self):
-        assert len(Channel) == 6
+    def test_no_unexpected_channels(self):
+        assert set(Channel) == set(map(Channel, _CHANNEL_NAMES))
 
 
 # ============================================================================
 # Unit tests: EVENT_CHANNELS mapping
 # ============================================================================
 
+@pytest.mark.xdist_group(name="ws_inproc")
 class TestEventChannels:
     """Tests for the event-to-channel mapping."""
 
-    def test_all_events_have_mapping(self):
+    @pytest.mark.parametrize("event", _EVENTS)
+    def test_all_events_have_mapping(self, event):
         """Every event in EVENT_ARG_NAMES should have a channel mapping."""
-        for event in EVENT_ARG_NAMES:
-            assert event in EVENT_CHANNELS, f"Missing channel mapping for {event}"
+        assert event in EVENT_CHANNELS, f"Missing channel mapping for {event}"
 
-    def test_events_channel_always_included(self):
+    @pytest.mark.parametrize("event", _MAPPED_EVENTS)
+    def test_events_channel_always_included(self, event):
         """Channel.events should be in every event's channel set."""
-        for event, channels in EVENT_CHANNELS.items():
-            assert Channel.events in channels, \
-                f"Channel.events missing for {event}"
+        assert Channel.events in EVENT_CHANNELS[event], \
+            f"Channel.events missing for {event}"
 
     def test_chat_events_mapped_to_chat_channel(self):
         assert Channel.chat in EVENT_CHANNELS["chat_message"]
@@ -292,6 +371,7 @@ class TestEventChannels:
 # Unit tests: EVENT_ARG_NAMES
 # ============================================================================
 
+@pytest.mark.xdist_group(name="ws_inproc")
 class TestEventArgNames:
     """Tests for event argument name mappings."""
 
@@ -309,15 +389,17 @@ class TestEventArgNames:
     def test_hub_connected_args(self):
         assert EVENT_ARG_NAMES["hub_connected"] == ("hub_url", "hub_name")
 
-    def test_all_arg_names_are_tuples(self):
-        for event, names in EVENT_ARG_NAMES.items():
-            assert isinstance(names, tuple), f"{event} args not a tuple"
+    @pytest.mark.parametrize("event", _EVENTS)
+    def test_all_arg_names_are_tuples(self, event):
+        assert isinstance(EVENT_ARG_NAMES[event], tuple), \
+            f"{event} args not a tuple"
 
 
 # ============================================================================
 # Unit tests: _serialize_event
 # ============================================================================
 
+@pytest.mark.xdist_group(name="ws_inproc")
 class TestSerializeEvent:
     """Tests for the _serialize_event function."""
 
@@ -361,6 +443,31 @@ class TestSerializeEvent:
         assert result["data"]["hub_url"] == "dchub://x:411"
         assert "hub_name" not in result["data"]
 
+    def test_extra_args_ignored(self):
+        result = _serialize_event("hub_connected", ("u", "n", "surplus"))
+        assert result["data"] == {"hub_url": "u", "hub_name": "n"}
+
+    def test_timestamp_reused_within_millisecond(self, monkeypatch):
+        base = 1_800_000_000_000_000_000
+        now = [base]
+        monkeypatch.setattr(websocket_mod, "_ts_cache", (0, ""))
+        monkeypatch.setattr(websocket_mod.time, "time_ns", lambda: now[0])
+
+        first = _serialize_event("hub_connecting", ("u",))["timestamp"]
+        now[0] = base + 999_999
+        assert _serialize_event("hub_connecting", ("u",))["timestamp"] == first
+        now[0] = base + 1_000_000
+        later = _serialize_event("hub_connecting", ("u",))["timestamp"]
+        assert later != first
+        assert later.endswith("+00:00")
+
+    def test_dumps_round_trips(self):
+        msg = _serialize_event("chat_message",
+                               ("dchub://hub:411", "Bob", "hi ✓", True))
+        text = _dumps(msg)
+        assert isinstance(text, str)
+        assert json.loads(text) == msg
+
     def test_timestamp_is_iso_format(self):
         result = _serialize_event("hub_connected", ("url", "name"))
         ts = result["timestamp"]
@@ -374,6 +481,29 @@ class TestSerializeEvent:
 # Unit tests: ConnectionManager
 # ============================================================================
 
+class _FakeWS:
+    """Bare-bones stand-in for a Starlette WebSocket (no mock bookkeeping)."""
+
+    def __init__(self):
+        self.sent: list[str] = []
+        self.accepted = False
+        self.client_state = WebSocketState.CONNECTED
+
+    async def accept(self):
+        self.accepted = True
+
+    async def send_text(self, text):
+        self.sent.append(text)
+
+
+class _FailingWS(_FakeWS):
+    """A socket whose peer has gone away: every send raises."""
+
+    async def send_text(self, text):
+        raise RuntimeError("connection closed")
+
+
+@pytest.mark.xdist_group(name="ws_inproc")
 class TestConnectionManager:
     """Tests for the ConnectionManager class."""
 
@@ -386,8 +516,7 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_connect_and_disconnect(self):
         mgr = ConnectionManager()
-        ws = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
+        ws = _FakeWS()
         user = UserRecord(username="test", hashed_password="x", role=UserRole.admin)
         channels = {Channel.events}
 
@@ -395,7 +524,7 @@ class TestConnectionManager:
         assert mgr.connection_count == 1
         assert conn.user.username == "test"
         assert conn.channels == {Channel.events}
-        ws.accept.assert_awaited_once()
+        assert ws.accepted
 
         await mgr.disconnect(conn)
         assert mgr.connection_count == 0
@@ -403,7 +532,7 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_disconnect_idempotent(self):
         mgr = ConnectionManager()
-        ws = AsyncMock()
+        ws = _FakeWS()
         user = UserRecord(username="test", hashed_password="x", role=UserRole.admin)
         conn = await mgr.connect(ws, user, {Channel.events})
         await mgr.disconnect(conn)
@@ -416,10 +545,8 @@ class TestConnectionManager:
         mgr = ConnectionManager()
         msg = {"type": "test", "data": "hello"}
 
-        ws1 = AsyncMock()
-        ws1.client_state = WebSocketState.CONNECTED
-        ws2 = AsyncMock()
-        ws2.client_state = WebSocketState.CONNECTED
+        ws1 = _FakeWS()
+        ws2 = _FakeWS()
 
         user = UserRecord(username="u1", hashed_password="x", role=UserRole.admin)
 
@@ -427,8 +554,8 @@ class TestConnectionManager:
         conn2 = await mgr.connect(ws2, user, {Channel.search})
 
         await mgr.broadcast(msg, {Channel.chat})
-        ws1.send_text.assert_awaited_once()
-        ws2.send_text.assert_not_awaited()
+        assert len(ws1.sent) == 1
+        assert ws2.sent == []
 
         await mgr.disconnect(conn1)
         await mgr.disconnect(conn2)
@@ -436,22 +563,43 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_broadcast_to_events_channel(self):
         mgr = ConnectionManager()
-        ws = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
+        ws = _FakeWS()
         user = UserRecord(username="u", hashed_password="x", role=UserRole.admin)
         conn = await mgr.connect(ws, user, {Channel.events})
 
         await mgr.broadcast({"test": 1}, {Channel.events, Channel.chat})
-        ws.send_text.assert_awaited_once()
+        assert len(ws.sent) == 1
 
         await mgr.disconnect(conn)
 
+    @pytest.mark.asyncio
+    async def test_subscribe_and_unsubscribe_route_broadcasts(self):
+        mgr = ConnectionManager()
+        ws = _FakeWS()
+        user = UserRecord(username="u", hashed_password="x", role=UserRole.admin)
+        conn = await mgr.connect(ws, user, {Channel.events})
+
+        await mgr.broadcast({"n": 1}, {Channel.search})
+        assert ws.sent == []
+
+        await mgr.subscribe(conn, {Channel.search})
+        assert Channel.search in conn.channels
+        await mgr.broadcast({"n": 2}, {Channel.search})
+        assert len(ws.sent) == 1
+
+        await mgr.unsubscribe(conn, {Channel.search})
+        assert Channel.search not in conn.channels
+        await mgr.broadcast({"n": 3}, {Channel.search})
+        assert len(ws.sent) == 1
+
+        await mgr.disconnect(conn)
+        await mgr.broadcast({"n": 4}, {Channel.events})
+        assert len(ws.sent) == 1
+
     @pytest.mark.asyncio
     async def test_broadcast_removes_dead_connections(self):
         mgr = ConnectionManager()
-        ws = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
-        ws.send_text.side_effect = RuntimeError("connection closed")
+        ws = _FailingWS()
 
         user = UserRecord(username="u", hashed_password="x", role=UserRole.admin)
         await mgr.connect(ws, user, {Channel.events})
@@ -460,17 +608,48 @@ class TestConnectionManager:
         await mgr.broadcast({"test": 1}, {Channel.events})
         assert mgr.connection_count == 0
 
+    @pytest.mark.asyncio
+    async def test_broadcast_dead_connection_does_not_block_others(self):
+        mgr = ConnectionManager()
+        user = UserRecord(username="u", hashed_password="x", role=UserRole.admin)
+        dead_ws = _FailingWS()
+        live_ws = _FakeWS()
+        await mgr.connect(dead_ws, user, {Channel.events})
+        live = await mgr.connect(live_ws, user, {Channel.events})
+
+        await mgr.broadcast({"test": 1}, {Channel.events})
+        assert len(live_ws.sent) == 1
+        assert mgr.connection_count == 1
+
+        await mgr.disconnect(live)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self):
+        mgr = ConnectionManager()
+        user = UserRecord(username="u", hashed_password="x", role=UserRole.admin)
+        sockets = [_FakeWS() for _ in range(3)]
+        conns = [await mgr.connect(ws, user, {Channel.events}) for ws in sockets]
+
+        with patch("eiskaltdcpp.api.websocket._dumps",
+                   wraps=_dumps) as dumps:
+            await mgr.broadcast({"test": 1}, {Channel.events})
+            await mgr.broadcast({"test": 2}, {Channel.chat})  # no subscribers
+        assert dumps.call_count == 1
+        assert all(ws.sent == sockets[0].sent for ws in sockets)
+
+        for conn in conns:
+            await mgr.disconnect(conn)
+
     @pytest.mark.asyncio
     async def test_send_personal(self):
         mgr = ConnectionManager()
-        ws = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
+        ws = _FakeWS()
         user = UserRecord(username="u", hashed_password="x", role=UserRole.admin)
         conn = await mgr.connect(ws, user, {Channel.events})
 
         await mgr.send_personal(conn, {"type": "hello"})
-        ws.send_text.assert_awaited_once()
-        payload = json.loads(ws.send_text.call_args[0][0])
+        assert len(ws.sent) == 1
+        payload = json.loads(ws.sent[0])
         assert payload["type"] == "hello"
 
         await mgr.disconnect(conn)
@@ -478,9 +657,7 @@ class TestConnectionManager:
     @pytest.mark.asyncio
     async def test_send_personal_handles_error(self):
         mgr = ConnectionManager()
-        ws = AsyncMock()
-        ws.client_state = WebSocketState.CONNECTED
-        ws.send_text.side_effect = RuntimeError("closed")
+        ws = _FailingWS()
         user = UserRecord(username="u", hashed_password="x", role=UserRole.admin)
         conn = await mgr.connect(ws, user, {Channel.events})
 
@@ -500,9 +677,10 @@ class TestConnectionManager:
 # Unit tests: _ClientConnection
 # ============================================================================
 
+@pytest.mark.xdist_group(name="ws_inproc")
 class TestClientConnection:
     def test_slots(self):
-        ws = MagicMock()
+        ws = _FakeWS()
         user = UserRecord(username="x", hashed_password="h", role=UserRole.admin)
         conn = _ClientConnection(ws, user, {Channel.events})
         assert conn.ws is ws
@@ -515,6 +693,7 @@ class TestClientConnection:
 # Integration tests: WebSocket endpoint
 # ============================================================================
 
+@pytest.mark.xdist_group(name="ws_http")
 class TestWebSocketEndpoint:
     """Tests for the /ws/events WebSocket endpoint."""
 
@@ -528,6 +707,16 @@ class TestWebSocketEndpoint:
             assert msg["role"] == "admin"
             assert "events" in msg["channels"]
 
+    def test_ws_connect_after_http_login(self, app):
+        resp = app.post("/api/auth/login", json={
+            "username": ADMIN_USER,
+            "password": ADMIN_PASS,
+        })
+        assert resp.status_code == 200
+        token = resp.json()["access_token"]
+        with app.websocket_connect(f"/ws/events?token={token}") as ws:
+            assert ws.receive_json()["user"] == ADMIN_USER
+
     def test_ws_connect_no_token_rejected(self, app):
         with pytest.raises(Exception):
             with app.websocket_connect("/ws/events") as ws:
@@ -549,6 +738,7 @@ class TestWebSocketEndpoint:
             assert set(msg["channels"]) == {"events", "chat", "search"}
 
     def test_ws_ping_pong(self, app, admin_token):
+        """End-to-end frame round trip through the receive loop."""
         with app.websocket_connect(
             f"/ws/events?token={admin_token}&channels=events"
         ) as ws:
@@ -557,50 +747,6 @@ class TestWebSocketEndpoint:
             msg = ws.receive_json()
             assert msg["type"] == "pong"
 
-    def test_ws_subscribe(self, app, admin_token):
-        with app.websocket_connect(
-            f"/ws/events?token={admin_token}&channels=events"
-        ) as ws:
-            ws.receive_json()  # welcome
-            ws.send_json({"type": "subscribe", "channels": ["chat", "search"]})
-            msg = ws.receive_json()
-            assert msg["type"] == "subscribed"
-            assert "chat" in msg["channels"]
-            assert "search" in msg["channels"]
-            assert "events" in msg["channels"]
-
-    def test_ws_unsubscribe(self, app, admin_token):
-        with app.websocket_connect(
-            f"/ws/events?token={admin_token}&channels=events,chat,search"
-        ) as ws:
-            ws.receive_json()  # welcome
-            ws.send_json({"type": "unsubscribe", "channels": ["search"]})
-            msg = ws.receive_json()
-            assert msg["type"] == "subscribed"
-            assert "search" not in msg["channels"]
-            assert "events" in msg["channels"]
-            assert "chat" in msg["channels"]
-
-    def test_ws_unknown_message_type(self, app, admin_token):
-        with app.websocket_connect(
-            f"/ws/events?token={admin_token}&channels=events"
-        ) as ws:
-            ws.receive_json()  # welcome
-            ws.send_json({"type": "foobar"})
-            msg = ws.receive_json()
-            assert msg["type"] == "error"
-            assert "Unknown" in msg["message"]
-
-    def test_ws_invalid_json(self, app, admin_token):
-        with app.websocket_connect(
-            f"/ws/events?token={admin_token}&channels=events"
-        ) as ws:
-            ws.receive_json()  # welcome
-            ws.send_text("not-valid-json{{{")
-            msg = ws.receive_json()
-            assert msg["type"] == "error"
-            assert "JSON" in msg["message"]
-
     def test_ws_readonly_user_can_connect(self, app, readonly_token):
         with app.websocket_connect(
             f"/ws/events?token={readonly_token}&channels=events,chat"
@@ -609,18 +755,72 @@ class TestWebSocketEndpoint:
             assert msg["type"] == "connected"
             assert msg["role"] == "readonly"
 
-    def test_ws_default_channel_is_events(self, app, admin_token):
-        with app.websocket_connect(
-            f"/ws/events?token={admin_token}"
-        ) as ws:
-            msg = ws.receive_json()
-            assert "events" in msg["channels"]
 
-    def test_ws_invalid_channels_ignored(self, app, admin_token):
-        with app.websocket_connect(
-            f"/ws/events?token={admin_token}&channels=events,bogus,fake"
-        ) as ws:
-            msg = ws.receive_json()
-            assert "events" in msg["channels"]
-            assert "bogus" not in msg["channels"]
-            assert "fake" not in msg["channels"]
+# ============================================================================
+# Unit tests: client message handling (no HTTP upgrade)
+# ============================================================================
+
+@pytest.mark.xdist_group(name="ws_inproc")
+class TestParseChannels:
+    def test_default_channel_is_events(self):
+        assert _parse_channels("") == {Channel.events}
+
+    def test_invalid_channels_ignored(self):
+        assert _parse_channels("events,bogus,fake") == {Channel.events}
+
+    def test_names_normalized(self):
+        assert _parse_channels(" Chat ,SEARCH") == {Channel.chat,
+                                                     Channel.search}
+
+
+@pytest.mark.xdist_group(name="ws_inproc")
+class TestHandleClientMessage:
+    """Drive _handle_client_message with a fake socket on ws_manager."""
+
+    @pytest.fixture
+    async def conn(self):
+        user = UserRecord(username="u", hashed_password="x",
+                          role=UserRole.admin)
+        c = await ws_manager.connect(_FakeWS(), user, {Channel.events})
+        yield c
+        await ws_manager.disconnect(c)
+
+    @staticmethod
+    def _last_reply(conn) -> dict:
+        return json.loads(conn.ws.sent[-1])
+
+    @pytest.mark.asyncio
+    async def test_ping_pong(self, conn):
+        await _handle_client_message(conn, '{"type": "ping"}')
+        assert self._last_reply(conn) == {"type": "pong"}
+
+    @pytest.mark.asyncio
+    async def test_subscribe(self, conn):
+        await _handle_client_message(conn, json.dumps(
+            {"type": "subscribe", "channels": ["chat", "search"]}))
+        msg = self._last_reply(conn)
+        assert msg["type"] == "subscribed"
+        assert set(msg["channels"]) == {"events", "chat", "search"}
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self, conn):
+        await ws_manager.subscribe(conn, {Channel.chat, Channel.search})
+        await _handle_client_message(conn, json.dumps(
+            {"type": "unsubscribe", "channels": ["search"]}))
+        msg = self._last_reply(conn)
+        assert msg["type"] == "subscribed"
+        assert set(msg["channels"]) == {"events", "chat"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_message_type(self, conn):
+        await _handle_client_message(conn, '{"type": "foobar"}')
+        msg = self._last_reply(conn)
+        assert msg["type"] == "error"
+        assert "Unknown" in msg["message"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_json(self, conn):
+        await _handle_client_message(conn, "not-valid-json{{{")
+        msg = self._last_reply(conn)
+        assert msg["type"] == "error"
+        assert "JSON" in msg["message"]